@@ -1,39 +1,148 @@
-# API配置
-# API_TYPE = "deepseek"  # 可选值: "deepseek" 或 "ollama"
-#
-# # DeepSeek API配置
-# DEEPSEEK_API_URL = ""  # API地址
-# DEEPSEEK_API_KEY = ""  # API密钥
-# DEEPSEEK_MODEL = ""    # 模型名称
-
-# Ollama API配置
-OLLAMA_API_URL = "http://localhost:11434"  # Ollama API基础地址
-OLLAMA_MODEL = "codegeex4:latest"  # Ollama模型名称
-
-# GitHub配置
-GITHUB_TOKEN = "*****"  # 可选，不设置则使用未认证模式
-
-# 支持的文件类型
-SUPPORTED_EXTENSIONS = ['.php', '.jsp', '.asp', '.js', '.html', '.py', '.java']
-
-# UI主题配置
-THEMES = {
-    "深色主题": {
-        "main_bg": "#1e1e1e",
-        "secondary_bg": "#2d2d2d",
-        "text_color": "#ffffff",
-        "accent_color": "#007acc",
-        "border_color": "#404040",
-        "button_hover": "#005999",
-        "button_pressed": "#004c80"
-    },
-    "浅色主题": {
-        "main_bg": "#f5f5f5",
-        "secondary_bg": "#ffffff",
-        "text_color": "#333333",
-        "accent_color": "#2196f3",
-        "border_color": "#e0e0e0",
-        "button_hover": "#1976d2",
-        "button_pressed": "#1565c0"
-    }
+import os
+
+# API配置
+# API_TYPE = "deepseek"  # 可选值: "deepseek" 或 "ollama"
+#
+# # DeepSeek API配置
+# DEEPSEEK_API_URL = ""  # API地址
+# DEEPSEEK_API_KEY = ""  # API密钥
+# DEEPSEEK_MODEL = ""    # 模型名称
+
+# Ollama API配置
+OLLAMA_API_URL = "http://localhost:11434"  # Ollama API基础地址
+OLLAMA_MODEL = "codegeex4:latest"  # Ollama模型名称
+
+# 多节点 Ollama 配置：为空时只使用 OLLAMA_API_URL
+# 每个节点：{"url": "http://10.0.0.2:11434", "weight": 1, "max_concurrency": 4}
+# weight 越大分到的请求越多；max_concurrency 为该节点同时处理的请求上限（建议与其 OLLAMA_NUM_PARALLEL 一致）
+OLLAMA_ENDPOINTS = []
+
+# Ollama 客户端配置（连接池、重试与熔断）
+OLLAMA_POOL_SIZE = 16  # 连接池中保持的 keep-alive 连接数
+OLLAMA_CONNECT_TIMEOUT = 5  # 建立连接的超时时间（秒）
+OLLAMA_AUDIT_TIMEOUT = 300  # 代码审计请求的读取超时（秒）
+OLLAMA_WEBSHELL_TIMEOUT = 30  # Webshell 检测请求的读取超时（秒）
+OLLAMA_CHAT_TIMEOUT = 70  # AI 对话请求的读取超时（秒）
+OLLAMA_MAX_RETRIES = 2  # 5xx 或连接中断时的最大重试次数
+OLLAMA_RETRY_BACKOFF = 1.0  # 重试退避基准时间（秒），按 2 的指数增长并加随机抖动
+OLLAMA_BREAKER_THRESHOLD = 5  # 连续失败达到该次数后熔断
+OLLAMA_BREAKER_COOLDOWN = 30  # 熔断持续时间（秒），之后放行一次试探请求
+
+# 模型预热与驻留配置
+OLLAMA_WARMUP_ENABLED = True  # 扫描和对话开始前预加载模型，首个文件不再承担模型加载时间
+OLLAMA_WARMUP_TIMEOUT = 300  # 预热（加载模型）请求的读取超时（秒）
+OLLAMA_KEEP_ALIVE = "30m"  # 每次请求都会刷新模型驻留时间，文件之间的空闲不会导致模型被卸载
+
+# 流式响应配置
+OLLAMA_STREAM = True  # 流式接收审计结果，明确无发现或超出长度上限时提前断开
+AUDIT_STREAM_MAX_CHARS = 8000  # 单次生成（含思考过程）的最大字符数，0 表示不限制
+
+# 审计并发配置
+AUDIT_CONCURRENCY = 4  # 同时发往 Ollama 的审计请求数，建议与服务端 OLLAMA_NUM_PARALLEL 保持一致（多节点时默认取各节点 max_concurrency 之和）
+
+# 文件遍历配置
+WALK_EXCLUDE_DIRS = ['.git', '.svn', '.hg', 'node_modules', 'bower_components', 'vendor', 'dist', 'target',
+                     '__pycache__', '.idea', '.vscode']  # 遍历时整体跳过的目录名
+WALK_RESPECT_GITIGNORE = True  # 跳过 .gitignore 中忽略的文件和目录
+WALK_MAX_FILE_BYTES = 5 * 1024 * 1024  # 超过该大小的文件不审计，0 表示不限制
+WALK_BINARY_SNIFF_BYTES = 8192  # 检查文件开头的字节数，含 NUL 字节视为二进制并跳过，0 表示不检查
+
+# 文件流水线配置（遍历 → 读取 → 预筛 → 模型审计，各级之间为有界队列）
+PIPELINE_READERS = 2  # 登记文件（stat，增量审计时读取比对）的线程数
+PIPELINE_QUEUE_SIZE = 64  # 每级队列最多缓存的文件数，审计跟不上时上游阻塞等待，内存占用保持稳定
+CONTENT_MMAP_MIN_BYTES = 1024 * 1024  # 不小于该大小的文件通过 mmap 读取并直接解码
+
+# 压缩包扫描配置
+ARCHIVE_SCAN_ENABLED = True  # 把 jar/war/zip 当作目录扫描（含嵌套的包），直接从包内读取，不解压到磁盘
+ARCHIVE_EXTENSIONS = ['.jar', '.war', '.ear', '.zip']
+ARCHIVE_MAX_DEPTH = 3  # 最多展开的压缩包层数（app.war → WEB-INF/lib/x.jar 为 2 层）
+ARCHIVE_MAX_NESTED_BYTES = 64 * 1024 * 1024  # 嵌套的包需要读入内存展开，超过该大小的不展开
+
+# JS 接口提取配置
+JS_EXTRACT_ENGINE = 'tokenizer'  # tokenizer：单遍扫描字符串字面量（线性耗时）；regex：原正则实现
+JS_EXTRACT_PROCESSES = 0  # 并行提取的进程数，0 表示 CPU 核数
+JS_EXTRACT_BATCH_BYTES = 4 * 1024 * 1024  # 每个子任务处理的文件总大小，超过该大小的 bundle 单独成为一个子任务
+JS_EXTRACT_INLINE_BYTES = 2 * 1024 * 1024  # 待分析文件总大小低于该值时直接在后台线程中提取，不启动进程池
+JS_EXTRACT_EXCLUDE_DIRS = ['.git', '.svn', '.hg', '__pycache__', '.idea', '.vscode']  # 提取接口时跳过的目录，dist、node_modules 等构建产物正是要分析的对象
+JS_EXTRACT_MAX_FILE_BYTES = 0  # 提取接口时单个文件的大小上限，0 表示不限制（打包后的 bundle 往往超过审计的大小上限）
+JS_CACHE_ENABLED = True  # 按文件内容哈希缓存提取结果，其他项目中相同的 bundle 直接复用
+JS_CACHE_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'cache', 'js_cache.db')
+JS_CACHE_MAX_AGE_DAYS = 90  # 缓存条目在该天数内未被使用则淘汰
+JS_KNOWN_LIBRARIES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'known_js_libraries.txt')  # 直接跳过的第三方库哈希列表
+JS_ROUTE_MAX_SOURCES = 5  # 合并后的每条 API 路由最多保留的来源文件数
+
+# 远程 JS 爬取配置
+JS_CRAWL_MAX_DEPTH = 3  # 从页面出发最多跟随的脚本引用层数（页面 → 入口脚本 → chunk …）
+JS_CRAWL_MAX_BYTES = 100 * 1024 * 1024  # 一次爬取最多下载的总字节数
+JS_CRAWL_MAX_FILE_BYTES = 20 * 1024 * 1024  # 单个响应的大小上限（解压后）
+JS_CRAWL_MAX_FILES = 500  # 一次爬取最多下载的文件数
+JS_CRAWL_PER_HOST = 6  # 每个主机的并发连接数
+JS_CRAWL_TIMEOUT = 20  # 单个请求的超时时间（秒）
+JS_CRAWL_SAME_HOST = True  # 只下载与目标地址同一主机的脚本
+JS_CRAWL_VERIFY_TLS = True  # 校验 HTTPS 证书，测试自签名证书的站点时可关闭
+JS_CRAWL_USER_AGENT = 'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0 Safari/537.36'
+JS_CRAWL_CACHE_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'cache', 'http_cache.db')
+
+# 项目目录监控配置
+PROJECT_WATCH_POLL_INTERVAL = 1.0  # inotify 不可用时轮询 projects 目录的间隔（秒）
+
+# 文件索引配置
+FILE_INDEX_ENABLED = True  # 为每个项目维护文件索引（路径、大小、修改时间、内容哈希），未变化的文件重扫时只需 stat
+FILE_INDEX_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'cache', 'file_index')
+
+# 审计结果缓存配置
+AUDIT_CACHE_ENABLED = True  # 内容未变化的文件直接复用上次的审计结论
+AUDIT_CACHE_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'cache', 'audit_cache.db')
+AUDIT_CACHE_MAX_MB = 200  # 缓存文件大小上限，超出后按最近使用时间淘汰
+AUDIT_CACHE_MAX_AGE_DAYS = 30  # 缓存条目最长保留天数
+
+# 小文件批量审计配置
+AUDIT_BATCH_ENABLED = False  # 把多个小文件打包进同一个提示词，减少请求次数
+AUDIT_BATCH_MAX_FILE_CHARS = 1500  # 不超过该字符数的文件才参与打包
+AUDIT_BATCH_TOKEN_BUDGET = 3000  # 单个批量提示词的 token 预算（含指令部分）
+
+# 静态预筛配置
+AUDIT_TRIAGE_ENABLED = True  # 先用规则筛掉没有危险函数/用户输入特征的文件，界面上可勾选“全量审计”跳过
+AUDIT_TRIAGE_THRESHOLD = 3  # 风险分达到该值的文件才送模型审计（命中一个危险函数或用户输入点即为 3 分）
+
+# 大文件分片审计配置
+AUDIT_CHUNK_CHARS = 3000  # 单个分片的最大字符数，超过该长度的文件按函数/行边界切片
+AUDIT_CHUNK_OVERLAP_LINES = 10  # 相邻分片之间重叠的行数
+AUDIT_MAX_CHUNKS_PER_FILE = 50  # 单个文件最多审计的分片数，0 表示不限制
+
+# GitHub配置
+GITHUB_TOKEN = "*****"  # 可选，不设置则使用未认证模式
+
+# 增量审计配置
+INCREMENTAL_STATE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'cache', 'incremental')
+INCREMENTAL_HUNKS_ONLY = False  # 只审计变更片段及上下文，而不是整个变更文件
+INCREMENTAL_HUNK_CONTEXT = 20  # 变更片段前后保留的上下文行数
+
+# 界面进度显示配置
+PROGRESS_FLUSH_INTERVAL_MS = 100  # 工作线程的进度事件先汇总，界面按该间隔刷新一次（100ms 即 10 Hz）
+PROGRESS_RATE_WINDOW = 10.0  # 速率和剩余时间按最近多少秒的进度估算
+
+# 支持的文件类型
+SUPPORTED_EXTENSIONS = ['.php', '.jsp', '.asp', '.js', '.html', '.py', '.java']
+
+# UI主题配置
+THEMES = {
+    "深色主题": {
+        "main_bg": "#1e1e1e",
+        "secondary_bg": "#2d2d2d",
+        "text_color": "#ffffff",
+        "accent_color": "#007acc",
+        "border_color": "#404040",
+        "button_hover": "#005999",
+        "button_pressed": "#004c80"
+    },
+    "浅色主题": {
+        "main_bg": "#f5f5f5",
+        "secondary_bg": "#ffffff",
+        "text_color": "#333333",
+        "accent_color": "#2196f3",
+        "border_color": "#e0e0e0",
+        "button_hover": "#1976d2",
+        "button_pressed": "#1565c0"
+    }
 } 
\ No newline at end of file
@@ -1,2 +1,15 @@
-from .github_scanner import GitHubScanner
-from .workers import HackerWorker, WebshellWorker 
\ No newline at end of file
+# 子模块按需导入：命令行模式（python -m core.cli）不加载 PyQt5 和 GitPython
+_LAZY_EXPORTS = {
+    'GitHubScanner': 'github_scanner',
+    'HackerWorker': 'workers',
+    'WebshellWorker': 'workers',
+    'JSExtractWorker': 'workers',
+    'JSCrawlWorker': 'workers',
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_EXPORTS:
+        from importlib import import_module
+        return getattr(import_module(f'.{_LAZY_EXPORTS[name]}', __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
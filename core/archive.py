@@ -0,0 +1,126 @@
+import io
+import os
+import threading
+import zipfile
+import zlib
+from collections import OrderedDict, namedtuple
+
+from config import ARCHIVE_EXTENSIONS, ARCHIVE_MAX_DEPTH, ARCHIVE_MAX_NESTED_BYTES
+
+ARCHIVE_SEPARATOR = '!/'  # 压缩包内文件的虚拟路径：app.war!/WEB-INF/x.jsp，嵌套时继续拼接
+
+
+
+class MemberTooLarge(ValueError):
+    """压缩包内文件解压后超过大小上限（中央目录中记录的大小可以伪造，如压缩炸弹）"""
+
+
+# 读取损坏、加密或使用不支持的压缩算法的包时可能抛出的异常
+ARCHIVE_ERRORS = (OSError, zipfile.BadZipFile, zipfile.LargeZipFile, KeyError, RuntimeError,
+                  NotImplementedError, EOFError, zlib.error, MemberTooLarge)
+
+ArchiveEntry = namedtuple('ArchiveEntry', ['path', 'size', 'mtime'])
+
+
+def is_virtual(path):
+    """是否为压缩包内文件的虚拟路径"""
+    return ARCHIVE_SEPARATOR in path
+
+
+def outer_path(path):
+    """虚拟路径所在的最外层压缩包（磁盘上的真实文件），普通路径原样返回"""
+    return path.split(ARCHIVE_SEPARATOR, 1)[0]
+
+
+def read_member(archive, name, limit=0):
+    """解压包内的一个文件，最多读取 limit 字节（0 表示不限制），超过时抛出 MemberTooLarge"""
+    with archive.open(name) as member:
+        data = member.read(limit + 1) if limit else member.read()
+    if limit and len(data) > limit:
+        raise MemberTooLarge(f"解压后超过 {limit} 字节，已跳过")
+    return data
+
+
+def iter_archive(path, extensions, max_size=0, mtime=None, max_depth=ARCHIVE_MAX_DEPTH,
+                 max_nested=ARCHIVE_MAX_NESTED_BYTES, stats=None, errors=None):
+    """列出压缩包中匹配扩展名的文件，产出 ArchiveEntry(虚拟路径, 解压后大小, 压缩包修改时间)
+
+    按包内路径排序产出；只读取中央目录，不解压匹配的文件；嵌套的包（如 WEB-INF/lib/*.jar）在内存中展开，
+    最多 max_depth 层，超过 max_nested 字节的嵌套包不展开。无法打开的包记入 errors [(路径, 错误信息)]。
+    """
+    suffixes = {ext.lower() for ext in extensions}
+    try:
+        with zipfile.ZipFile(path) as archive:
+            yield from _iter_members(archive, path, suffixes, max_size, mtime, max_depth, max_nested, stats, errors)
+    except ARCHIVE_ERRORS as e:
+        if errors is not None:
+            errors.append((path, str(e)))
+
+
+def _iter_members(archive, prefix, suffixes, max_size, mtime, depth, max_nested, stats, errors):
+    for info in sorted(archive.infolist(), key=lambda info: info.filename):
+        if info.is_dir():
+            continue
+        path = prefix + ARCHIVE_SEPARATOR + info.filename
+        suffix = os.path.splitext(info.filename)[1].lower()
+        if stats is not None:
+            stats.walked += 1
+        if suffix in ARCHIVE_EXTENSIONS:
+            if depth <= 1 or (max_nested and info.file_size > max_nested):
+                continue
+            try:
+                with zipfile.ZipFile(io.BytesIO(read_member(archive, info, max_nested))) as nested:
+                    yield from _iter_members(nested, path, suffixes, max_size, mtime, depth - 1, max_nested,
+                                             stats, errors)
+            except ARCHIVE_ERRORS as e:
+                if errors is not None:
+                    errors.append((path, str(e)))
+        elif suffix in suffixes:
+            if max_size and info.file_size > max_size:
+                if stats is not None:
+                    stats.too_large += 1
+                continue
+            yield ArchiveEntry(path, info.file_size, mtime)
+
+
+class ArchiveReader:
+    """按虚拟路径读取压缩包内的文件
+
+    最近使用的包（含已在内存中展开的嵌套包）保持打开，同一个包内的多个文件不必重复解析中央目录。
+    读取由锁串行化，可在多个审计线程中共用。
+    实际解压的字节数受 max_size（普通文件）和 max_nested（嵌套包）限制，不依赖中央目录中可伪造的大小。
+    """
+
+    def __init__(self, max_open=4, max_size=0, max_nested=ARCHIVE_MAX_NESTED_BYTES):
+        self.max_open = max_open
+        self.max_size = max_size
+        self.max_nested = max_nested
+        self._open = OrderedDict()  # {包的虚拟路径: ZipFile}
+        self._lock = threading.Lock()
+
+    def _archive(self, path):
+        archive = self._open.get(path)
+        if archive is not None:
+            self._open.move_to_end(path)
+            return archive
+        if is_virtual(path):
+            parent, member = path.rsplit(ARCHIVE_SEPARATOR, 1)
+            archive = zipfile.ZipFile(io.BytesIO(read_member(self._archive(parent), member, self.max_nested)))
+        else:
+            archive = zipfile.ZipFile(path)
+        self._open[path] = archive
+        while len(self._open) > self.max_open:
+            self._open.popitem(last=False)[1].close()
+        return archive
+
+    def read(self, path):
+        """读取虚拟路径对应的文件内容（bytes），失败或超过 max_size 时抛出 ARCHIVE_ERRORS 中的异常"""
+        archive_path, member = path.rsplit(ARCHIVE_SEPARATOR, 1)
+        with self._lock:
+            return read_member(self._archive(archive_path), member, self.max_size)
+
+    def close(self):
+        with self._lock:
+            for archive in self._open.values():
+                archive.close()
+            self._open.clear()
@@ -0,0 +1,281 @@
+import asyncio
+import os
+import sqlite3
+import ssl
+import threading
+import time
+import zlib
+from collections import namedtuple
+from urllib.parse import urlsplit, urljoin
+
+from config import (JS_CRAWL_PER_HOST, JS_CRAWL_TIMEOUT, JS_CRAWL_VERIFY_TLS, JS_CRAWL_USER_AGENT,
+                    JS_CRAWL_CACHE_PATH)
+
+# status 为最终响应的状态码（304 时 body 取自缓存），url 为跟随重定向后的地址
+Response = namedtuple('Response', ['url', 'status', 'headers', 'body', 'from_cache'])
+
+_REDIRECTS = {301, 302, 303, 307, 308}
+_MAX_REDIRECTS = 5
+_MAX_HEADER_BYTES = 64 * 1024
+
+
+class HTTPError(Exception):
+    """请求失败（连接错误、响应格式错误、超时等）"""
+
+
+class BodyTooLarge(HTTPError):
+    """响应体超过允许的大小"""
+
+
+class HTTPCache:
+    """条件请求缓存：保存带 ETag / Last-Modified 的响应体，再次请求时发送 If-None-Match / If-Modified-Since，
+    服务端返回 304 时直接使用缓存的内容"""
+
+    def __init__(self, db_path=JS_CRAWL_CACHE_PATH):
+        os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS responses (
+                url TEXT PRIMARY KEY,
+                etag TEXT,
+                last_modified TEXT,
+                content_type TEXT,
+                body BLOB NOT NULL,
+                fetched_at REAL NOT NULL
+            )
+        """)
+        self._conn.commit()
+
+    def get(self, url):
+        """返回 (etag, last_modified, content_type, body)，未缓存时返回 None"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT etag, last_modified, content_type, body FROM responses WHERE url = ?", (url,)
+            ).fetchone()
+        if row is None:
+            return None
+        return row[0], row[1], row[2], zlib.decompress(row[3])
+
+    def put(self, url, headers, body):
+        """保存带校验信息的响应；既没有 ETag 也没有 Last-Modified 的响应无法条件请求，不保存"""
+        etag, last_modified = headers.get('etag'), headers.get('last-modified')
+        if not etag and not last_modified:
+            return
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (url, etag, last_modified, content_type, body, fetched_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (url, etag, last_modified, headers.get('content-type'), zlib.compress(body), time.time())
+            )
+            self._conn.commit()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+class AsyncHTTPClient:
+    """基于 asyncio 流的 HTTP/1.1 GET 客户端
+
+    同一主机的连接保持复用（keep-alive），每个主机同时最多 per_host 个请求；
+    支持 chunked、gzip/deflate、重定向，响应体超过 max_bytes（解压后）时中断读取并抛出 BodyTooLarge。
+    提供 cache（HTTPCache）时自动发送条件请求。所有方法须在同一个事件循环中调用。
+    """
+
+    def __init__(self, per_host=JS_CRAWL_PER_HOST, timeout=JS_CRAWL_TIMEOUT, cache=None,
+                 verify_tls=JS_CRAWL_VERIFY_TLS, user_agent=JS_CRAWL_USER_AGENT):
+        self.per_host = per_host
+        self.timeout = timeout
+        self.cache = cache
+        self.user_agent = user_agent
+        self.connections_opened = 0
+        self._idle = {}  # {(scheme, host, port): [(reader, writer)]}
+        self._slots = {}  # {(scheme, host, port): asyncio.Semaphore}
+        self._ssl = ssl.create_default_context()
+        if not verify_tls:
+            self._ssl.check_hostname = False
+            self._ssl.verify_mode = ssl.CERT_NONE
+
+    async def get(self, url, max_bytes=0):
+        """GET 请求，跟随重定向，返回 Response；失败时抛出 HTTPError"""
+        for _ in range(_MAX_REDIRECTS + 1):
+            cached = self.cache.get(url) if self.cache else None
+            headers = {}
+            if cached:
+                if cached[0]:
+                    headers['If-None-Match'] = cached[0]
+                if cached[1]:
+                    headers['If-Modified-Since'] = cached[1]
+            try:
+                status, response_headers, body = await asyncio.wait_for(
+                    self._request(url, headers, max_bytes), self.timeout
+                )
+            except asyncio.TimeoutError:
+                raise HTTPError(f"请求超时（{self.timeout}s）") from None
+            if status in _REDIRECTS and response_headers.get('location'):
+                url = urljoin(url, response_headers['location'])
+                continue
+            if status == 304 and cached:
+                if max_bytes and len(cached[3]) > max_bytes:
+                    raise BodyTooLarge(f"响应体 {len(cached[3])} 字节，超过上限 {max_bytes} 字节")
+                headers = dict(response_headers)
+                headers.setdefault('content-type', cached[2] or '')
+                return Response(url, 200, headers, cached[3], True)
+            if status == 200 and self.cache:
+                self.cache.put(url, response_headers, body)
+            return Response(url, status, response_headers, body, False)
+        raise HTTPError(f"重定向次数超过 {_MAX_REDIRECTS} 次")
+
+    async def _request(self, url, headers, max_bytes):
+        parts = urlsplit(url)
+        if parts.scheme not in ('http', 'https') or not parts.hostname:
+            raise HTTPError(f"不支持的地址: {url}")
+        key = (parts.scheme, parts.hostname, parts.port or (443 if parts.scheme == 'https' else 80))
+        slot = self._slots.setdefault(key, asyncio.Semaphore(self.per_host))
+        target = (parts.path or '/') + (f"?{parts.query}" if parts.query else '')
+        lines = [f"GET {target} HTTP/1.1", f"Host: {parts.netloc.rsplit('@', 1)[-1]}",
+                 f"User-Agent: {self.user_agent}", "Accept: */*", "Accept-Encoding: gzip, deflate",
+                 "Connection: keep-alive"]
+        lines.extend(f"{name}: {value}" for name, value in headers.items())
+        request = ("\r\n".join(lines) + "\r\n\r\n").encode('latin-1')
+
+        async with slot:
+            # 复用的空闲连接可能已被服务端关闭，此时换一个新连接重试一次
+            for reused in (True, False):
+                connection = self._take_idle(key) if reused else await self._connect(key)
+                if connection is None:
+                    continue
+                reader, writer = connection
+                try:
+                    writer.write(request)
+                    await writer.drain()
+                    status, response_headers, body, keep_alive = await self._read_response(reader, max_bytes)
+                except (ConnectionError, asyncio.IncompleteReadError) as e:
+                    writer.close()
+                    if reused:
+                        continue
+                    raise HTTPError(f"连接中断: {e}") from None
+                except BaseException:
+                    writer.close()
+                    raise
+                if keep_alive:
+                    self._idle.setdefault(key, []).append((reader, writer))
+                else:
+                    writer.close()
+                return status, response_headers, body
+
+    def _take_idle(self, key):
+        idle = self._idle.get(key)
+        while idle:
+            reader, writer = idle.pop()
+            if not reader.at_eof() and not writer.is_closing():
+                return reader, writer
+            writer.close()
+        return None
+
+    async def _connect(self, key):
+        scheme, host, port = key
+        try:
+            connection = await asyncio.open_connection(
+                host, port, ssl=self._ssl if scheme == 'https' else None,
+                server_hostname=host if scheme == 'https' else None, limit=_MAX_HEADER_BYTES
+            )
+        except (OSError, ssl.SSLError) as e:
+            raise HTTPError(f"无法连接 {host}:{port}: {e}") from None
+        self.connections_opened += 1
+        return connection
+
+    async def _read_response(self, reader, max_bytes):
+        """读取一个响应，返回 (状态码, {小写头名: 值}, 解压后的响应体, 连接能否复用)"""
+        while True:
+            try:
+                head = await reader.readuntil(b"\r\n\r\n")
+            except asyncio.LimitOverrunError:
+                raise HTTPError("响应头过大") from None
+            status_line, *header_lines = head.decode('latin-1').split("\r\n")
+            try:
+                version, status = status_line.split(' ', 2)[:2]
+                status = int(status)
+            except ValueError:
+                raise HTTPError(f"无法解析的响应: {status_line[:80]}") from None
+            # 跳过 100 Continue 等临时响应
+            if status >= 200:
+                break
+        headers = {}
+        for line in header_lines:
+            name, _, value = line.partition(':')
+            if name:
+                headers[name.strip().lower()] = value.strip()
+
+        connection = headers.get('connection', '').lower()
+        keep_alive = connection != 'close' and (version != 'HTTP/1.0' or connection == 'keep-alive')
+        body = bytearray()
+        if status in (204, 304):
+            return status, headers, bytes(body), keep_alive
+
+        decoder = _decoder(headers.get('content-encoding', ''))
+        length = headers.get('content-length')
+        if 'chunked' in headers.get('transfer-encoding', '').lower():
+            while True:
+                size_line = await reader.readuntil(b"\r\n")
+                try:
+                    size = int(size_line.split(b';', 1)[0].strip(), 16)
+                except ValueError:
+                    raise HTTPError("chunked 响应格式错误") from None
+                if size == 0:
+                    # 跳过可能存在的 trailer
+                    while await reader.readuntil(b"\r\n") != b"\r\n":
+                        pass
+                    break
+                _feed(body, decoder, await reader.readexactly(size), max_bytes)
+                await reader.readexactly(2)
+        elif length is not None:
+            remaining = int(length)
+            if max_bytes and decoder is None and remaining > max_bytes:
+                raise BodyTooLarge(f"响应体 {remaining} 字节，超过上限 {max_bytes} 字节")
+            while remaining:
+                chunk = await reader.read(min(remaining, 65536))
+                if not chunk:
+                    raise asyncio.IncompleteReadError(b'', remaining)
+                remaining -= len(chunk)
+                _feed(body, decoder, chunk, max_bytes)
+        else:
+            # 没有长度信息时读到连接关闭为止
+            keep_alive = False
+            while True:
+                chunk = await reader.read(65536)
+                if not chunk:
+                    break
+                _feed(body, decoder, chunk, max_bytes)
+        if decoder is not None:
+            _feed(body, None, decoder.flush(), max_bytes)
+        return status, headers, bytes(body), keep_alive
+
+    async def close(self):
+        for connections in self._idle.values():
+            for _, writer in connections:
+                writer.close()
+        self._idle.clear()
+
+
+def _decoder(encoding):
+    encoding = encoding.lower().strip()
+    if encoding in ('gzip', 'x-gzip'):
+        return zlib.decompressobj(16 + zlib.MAX_WBITS)
+    if encoding == 'deflate':
+        return zlib.decompressobj()
+    return None
+
+
+def _feed(body, decoder, data, max_bytes):
+    """追加一段响应数据（必要时先解压），超过 max_bytes 时抛出 BodyTooLarge"""
+    if decoder is not None:
+        try:
+            # 限制单次解压输出，防止压缩炸弹一次性占满内存
+            data = decoder.decompress(data, max_bytes + 1 - len(body) if max_bytes else 0)
+        except zlib.error as e:
+            raise HTTPError(f"解压响应失败: {e}") from None
+    body.extend(data)
+    if max_bytes and len(body) > max_bytes:
+        raise BodyTooLarge(f"响应体超过上限 {max_bytes} 字节")
@@ -0,0 +1,126 @@
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+
+from config import AUDIT_CACHE_PATH, AUDIT_CACHE_MAX_MB, AUDIT_CACHE_MAX_AGE_DAYS
+
+
+class AuditCache:
+    """LLM 审计结果的本地缓存
+
+    以 hash(文件内容, 提示词模板, 模型名) 为键保存模型的审计结论，
+    内容未变化的文件再次审计时直接复用结论，不再请求 Ollama。
+    """
+
+    def __init__(self, db_path=AUDIT_CACHE_PATH, max_mb=AUDIT_CACHE_MAX_MB,
+                 max_age_days=AUDIT_CACHE_MAX_AGE_DAYS):
+        self.db_path = db_path
+        self.max_bytes = int(max_mb * 1024 * 1024)
+        self.max_age = max_age_days * 86400
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+        os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+        # 审计线程池中的多个线程共用同一连接，由 _lock 串行化访问
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS verdicts (
+                key TEXT PRIMARY KEY,
+                verdict TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                created_at REAL NOT NULL,
+                last_used REAL NOT NULL
+            )
+        """)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_verdicts_last_used ON verdicts(last_used)")
+        self._conn.commit()
+
+    @staticmethod
+    def make_key(content, template, model):
+        """根据文件内容、提示词模板和模型名生成缓存键"""
+        digest = hashlib.sha256()
+        for part in (model, template, content):
+            digest.update(part.encode('utf-8', errors='replace'))
+            digest.update(b'\0')
+        return digest.hexdigest()
+
+    def get(self, key):
+        """查询缓存，未命中返回 None"""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT verdict, created_at FROM verdicts WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None or (self.max_age and now - row[1] > self.max_age):
+                self.misses += 1
+                return None
+            self._conn.execute("UPDATE verdicts SET last_used = ? WHERE key = ?", (now, key))
+            self._conn.commit()
+            self.hits += 1
+            return row[0]
+
+    def put(self, key, verdict):
+        """写入审计结论"""
+        now = time.time()
+        size = len(verdict.encode('utf-8', errors='replace'))
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO verdicts (key, verdict, size, created_at, last_used) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (key, verdict, size, now, now)
+            )
+            self._conn.commit()
+
+    def evict(self):
+        """按存活时间和数据库文件大小淘汰旧条目，返回删除的条目数"""
+        removed = 0
+        with self._lock:
+            if self.max_age:
+                cursor = self._conn.execute(
+                    "DELETE FROM verdicts WHERE created_at < ?", (time.time() - self.max_age,)
+                )
+                removed += cursor.rowcount
+
+            shrink = False
+            if self.max_bytes:
+                self._conn.commit()
+                used = self._used_bytes()
+                if used > self.max_bytes:
+                    # 数据库文件还包含键、索引和页内空隙，按结论大小与实际占用的比例换算出需要保留的结论总大小，
+                    # 再按最近使用时间从旧到新删除
+                    total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM verdicts").fetchone()[0]
+                    target = total * self.max_bytes / used
+                    stale = []
+                    for key, size in self._conn.execute("SELECT key, size FROM verdicts ORDER BY last_used"):
+                        if total <= target:
+                            break
+                        stale.append((key,))
+                        total -= size
+                    self._conn.executemany("DELETE FROM verdicts WHERE key = ?", stale)
+                    removed += len(stale)
+                    shrink = True
+            self._conn.commit()
+            if shrink:
+                # 删除只会留下空闲页，VACUUM 后文件才真正缩小到上限以内
+                self._conn.execute("VACUUM")
+        return removed
+
+    def _used_bytes(self):
+        """数据库实际占用的字节数（不含可复用的空闲页）"""
+        page_size = self._conn.execute("PRAGMA page_size").fetchone()[0]
+        pages = self._conn.execute("PRAGMA page_count").fetchone()[0]
+        free = self._conn.execute("PRAGMA freelist_count").fetchone()[0]
+        return (pages - free) * page_size
+
+    def summary(self):
+        """缓存命中统计"""
+        total = self.hits + self.misses
+        ratio = self.hits * 100.0 / total if total else 0.0
+        return f"💾 缓存命中 {self.hits} 次，未命中 {self.misses} 次（命中率 {ratio:.1f}%）"
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,612 @@
+import requests
+import json
+import os
+import queue
+import time
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+# 导入配置
+from config import OLLAMA_MODEL, AUDIT_CONCURRENCY, AUDIT_CACHE_ENABLED  # 直接从config.py导入
+from config import OLLAMA_AUDIT_TIMEOUT, OLLAMA_WEBSHELL_TIMEOUT, OLLAMA_STREAM, AUDIT_STREAM_MAX_CHARS
+from config import AUDIT_BATCH_ENABLED, AUDIT_BATCH_TOKEN_BUDGET, AUDIT_BATCH_MAX_FILE_CHARS
+from config import AUDIT_CHUNK_CHARS, AUDIT_CHUNK_OVERLAP_LINES, AUDIT_MAX_CHUNKS_PER_FILE
+from config import AUDIT_TRIAGE_ENABLED, AUDIT_TRIAGE_THRESHOLD, OLLAMA_WARMUP_ENABLED
+from core.audit_cache import AuditCache
+from core.batching import iter_batches, batch_labels, build_batch_block, split_batch_response, estimate_tokens
+from core.content_store import resolve, UNREADABLE
+from core.findings import FileEvent
+from core.chunker import split_into_chunks, render_chunk, merge_findings, chunk_signature, PARTIAL_NOTE, PARTIAL_MARK
+from core.ollama_client import get_client, LatencyStats, OllamaResponseError
+from core.triage import triage_files, should_audit
+
+
+def files_per_minute(count, elapsed):
+    """计算吞吐量（文件/分钟）"""
+    return count * 60.0 / elapsed if elapsed > 0 else 0.0
+
+
+def default_concurrency():
+    """默认并发数：配置了多个 Ollama 节点时取各节点并发上限之和，否则为 AUDIT_CONCURRENCY"""
+    return get_client().capacity or AUDIT_CONCURRENCY
+
+
+_DONE = object()
+_FEED_POLL_INTERVAL = 0.1  # 等待新 job 时收取已完成结果的间隔（秒）
+
+
+def single_jobs(items):
+    """每个文件单独作为一次模型请求"""
+    return ([item] for item in items)
+
+
+def source_items(source):
+    """统一两种文件来源，返回 (文件迭代器, 文件总数, 报告顺序)
+
+    source 为 {路径: 内容} 时总数固定；为流式来源（core.pipeline.FileSource）时，
+    总数是到目前为止发现的文件数，报告顺序为遍历顺序（审计结束后才完整）。
+    """
+    if isinstance(source, dict):
+        return iter(source.items()), len(source), list(source)
+    source.start()
+    return iter(source), lambda: source.pending_total, source.paths
+
+
+def _feed_jobs(jobs, feed, stop):
+    """在独立线程中拉取 job 放入有界队列，结束时放入 _DONE，出错时放入异常对象"""
+    try:
+        for job in jobs:
+            if not _put_until(feed, job, stop):
+                return
+        item = _DONE
+    except Exception as e:
+        item = e
+    _put_until(feed, item, stop)
+
+
+def _put_until(target, item, stop):
+    """放入有界队列；stop 被设置后放弃，避免阻塞在已无人消费的队列上"""
+    while not stop.is_set():
+        try:
+            target.put(item, timeout=0.2)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+
+def audit_concurrently(jobs, audit_job, concurrency, on_progress=None, total=None, on_result=None):
+    """用有界线程池并发审计文件
+
+    jobs 为 [[(filepath, content), ...], ...] 或按需产出 job 的生成器，每个 job 对应一次模型请求（单文件或批量）。
+    生成器在独立线程中拉取（可能阻塞在遍历/读取上），经有界队列交给调度循环：同时在途和预取的 job 都有上限，
+    上游的读取因此受到背压；等待新 job 时也会按时收取已完成的结果，遍历缓慢时进度不会停滞。
+    audit_job(job) 返回与 job 中文件一一对应的报告条目列表（无发现时为 None）。
+    total 为文件总数，流式来源时可以是返回当前已知总数的函数。
+    on_result(filepath, entry, done, total) 在每个文件完成时调用，done 为包含该文件在内的已完成数。
+    返回 {filepath: 报告条目}，由调用方按原始文件顺序输出，保证报告顺序稳定。
+    """
+    if total is None:
+        jobs = list(jobs)
+        total = sum(len(job) for job in jobs)
+    workers = max(1, int(concurrency))
+    feed = queue.Queue(maxsize=workers)
+    stop = threading.Event()
+    threading.Thread(target=_feed_jobs, args=(iter(jobs), feed, stop), daemon=True).start()
+    results = {}
+    pending = {}
+    done = 0
+    exhausted = False
+    start = time.time()
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            while True:
+                while not exhausted and len(pending) < workers * 2:
+                    try:
+                        # 有在途请求时不阻塞等待新 job，先去收取已完成的结果
+                        job = feed.get(timeout=_FEED_POLL_INTERVAL) if not pending else feed.get_nowait()
+                    except queue.Empty:
+                        break
+                    if job is _DONE:
+                        exhausted = True
+                    elif isinstance(job, Exception):
+                        raise job
+                    else:
+                        pending[pool.submit(audit_job, job)] = job
+                if exhausted and not pending:
+                    break
+                if not pending:
+                    continue
+                finished, _ = wait(pending, timeout=None if exhausted else _FEED_POLL_INTERVAL,
+                                   return_when=FIRST_COMPLETED)
+                for future in finished:
+                    job = pending.pop(future)
+                    known = total() if callable(total) else total
+                    for (filepath, _), entry in zip(job, future.result()):
+                        results[filepath] = entry
+                        done += 1
+                        if on_result:
+                            on_result(filepath, entry, done, max(done, known))
+                    if on_progress:
+                        rate = files_per_minute(done, time.time() - start)
+                        on_progress(job[-1][0], done, max(done, known), rate)
+    finally:
+        stop.set()
+    return results, time.time() - start
+
+
+# 流式输出超过 AUDIT_STREAM_MAX_CHARS 被截断、但已给出部分漏洞的结论末尾附加该说明，这类结论不写入缓存
+TRUNCATED_NOTE = "⚠️ 模型输出超过长度上限被截断，结论可能不完整"
+
+
+def check_truncated(result, reason):
+    """处理因超出输出上限而提前终止的回答
+
+    已给出漏洞的保留并注明被截断；没有任何漏洞的（如还停留在思考过程中）不能当作无发现，抛出 OllamaResponseError。
+    """
+    if reason != "max_chars":
+        return result
+    if '[高危]' not in result and '[中危]' not in result:
+        raise OllamaResponseError(f"模型输出超过 {AUDIT_STREAM_MAX_CHARS} 字符仍未给出结论")
+    return f"{result}\n{TRUNCATED_NOTE}"
+
+
+def analyze_in_chunks(filepath, content, build_prompt, request, pool):
+    """大文件按函数/行边界切成重叠分片并发审计，合并去重后返回结论
+
+    小文件只有一个分片，直接用原始内容生成提示词。
+    分片数超过 AUDIT_MAX_CHUNKS_PER_FILE 时在结论末尾注明实际覆盖的行范围。
+    """
+    chunks, truncated = split_into_chunks(
+        content, AUDIT_CHUNK_CHARS, AUDIT_CHUNK_OVERLAP_LINES, AUDIT_MAX_CHUNKS_PER_FILE
+    )
+    if len(chunks) == 1 and not truncated:
+        return request(build_prompt(content))
+
+    name = os.path.basename(filepath)
+    futures = [pool.submit(request, build_prompt(render_chunk(chunk, name))) for chunk in chunks]
+    verdicts = [future.result() for future in futures]
+    merged = merge_findings(verdicts)
+    if any(TRUNCATED_NOTE in verdict for verdict in verdicts) and TRUNCATED_NOTE not in merged:
+        merged = f"{merged}\n{TRUNCATED_NOTE}"
+    if truncated:
+        merged = "\n".join(filter(None, [merged, PARTIAL_NOTE.format(chunks[-1].end_line)]))
+    return merged
+
+
+def warm_up_model(emit):
+    """扫描开始前预加载模型并设置 keep_alive，避免首个文件承担模型加载时间，返回预热耗时"""
+    if not OLLAMA_WARMUP_ENABLED:
+        return None
+    emit(f"🔥 正在预热模型 {OLLAMA_MODEL}...")
+    elapsed, errors = get_client().warm_up()
+    for error in errors:
+        emit(f"⚠️ 模型预热失败：{error}")
+    if elapsed is not None:
+        emit(f"🔥 模型预热完成，用时 {elapsed:.1f}s")
+    return elapsed
+
+
+def first_result_summary(first_result, warmup):
+    """首个结果用时（含模型加载），与稳态请求耗时分开统计"""
+    if first_result is None:
+        return None
+    if warmup is None:
+        return f"🚀 首个结果用时 {first_result:.1f}s"
+    return f"🚀 首个结果用时 {first_result:.1f}s（含模型预热 {warmup:.1f}s，不计入下方的请求耗时）"
+
+
+def early_stop_summary(early_stops):
+    """流式提前终止统计"""
+    total = sum(early_stops.values())
+    if not total:
+        return None
+    return (f"⚡ 流式提前终止 {total} 次（明确无发现 {early_stops['no_finding']} 次，"
+            f"超出输出上限 {early_stops['max_chars']} 次）")
+
+
+def cache_template(prompt_template):
+    """缓存键使用的模板：提示词模板 + 分片参数"""
+    return prompt_template + chunk_signature(AUDIT_CHUNK_CHARS, AUDIT_CHUNK_OVERLAP_LINES, AUDIT_MAX_CHUNKS_PER_FILE)
+
+
+AUDIT_INSTRUCTIONS = """【强制指令】你是一个专业的安全审计AI，请按以下要求分析代码：
+        
+1. 漏洞分析流程：
+   1.1 识别潜在风险点（SQL操作、文件操作、用户输入点、文件上传漏洞、CSRF、SSRF、XSS、RCE、OWASP top10等漏洞）
+   1.2 验证漏洞可利用性
+   1.3 按CVSS评分标准评估风险等级
+
+2. 输出规则：
+   - 仅输出确认存在的高危/中危漏洞
+   - 使用严格格式：[风险等级] 类型 - 位置:行号 - 50字内描述
+   - 禁止解释漏洞原理
+   - 禁止给出修复建议
+   - 如果有可能，给出POC（HTTP请求数据包）
+
+3. 输出示例（除此外不要有任何输出）：
+   [高危] SQL注入 - user_login.php:32 - 未过滤的$_GET参数直接拼接SQL查询
+   [POC]POST /login.php HTTP/1.1
+   Host: example.com
+   Content-Type: application/x-www-form-urlencoded
+"""
+
+
+class CodeAuditor:
+    """代码审计引擎（不依赖 Qt，GUI 和命令行共用）
+
+    files_content 为 {路径: 内容} 或流式来源 core.pipeline.FileSource（边遍历边审计）。
+    on_progress 为进度回调，参数是一行进度文本；on_event 在每个文件完成时收到一个 core.findings.FileEvent
+    （提供 on_event 时不再输出逐文件的进度文本）；run() 返回完整报告文本，每个文件的报告条目保存在 file_results 中。
+    """
+
+    def __init__(self, files_content, concurrency=None, use_cache=AUDIT_CACHE_ENABLED,
+                 batch_mode=AUDIT_BATCH_ENABLED, triage=AUDIT_TRIAGE_ENABLED, carried=None, on_progress=None,
+                 on_event=None):
+        self.files_content = files_content
+        self.concurrency = concurrency or default_concurrency()
+        self.use_cache = use_cache
+        self.batch_mode = batch_mode
+        self.triage = triage
+        self.carried = carried if carried is not None else {}  # 增量审计中沿用的上次结论 {filepath: 报告条目}
+        self.on_progress = on_progress
+        self.on_event = on_event
+        self.file_results = {}
+
+    def run(self):
+        skipped = []
+        if self.triage and not isinstance(self.files_content, dict):
+            # 流式来源在读取线程中边读边筛（须在启动前设置），筛过的文件以已读出的文本交给审计，不再重复读取
+            self.files_content.screen = lambda path, text: should_audit(path, text, AUDIT_TRIAGE_THRESHOLD)
+            skipped = self.files_content.screened
+        items, total, order = source_items(self.files_content)
+        if self.triage and isinstance(self.files_content, dict):
+            # 静态预筛：只把命中危险函数/用户输入规则的文件交给模型
+            audit_files, skipped = triage_files(self.files_content, AUDIT_TRIAGE_THRESHOLD)
+            self._emit(
+                f"🧹 静态预筛完成：{len(audit_files)} 个文件送模型审计，跳过 {len(skipped)} 个"
+            )
+            items, total = iter(audit_files.items()), len(audit_files)
+
+        self._started = time.time()
+        self._first_result = None
+        self._warmup = warm_up_model(self._emit) if total else None
+
+        cache = AuditCache() if self.use_cache else None
+        # 大文件的分片由独立线程池执行，信号量保证同时发往 Ollama 的请求数不超过并发上限
+        self._request_slots = threading.BoundedSemaphore(max(1, int(self.concurrency)))
+        self._chunk_pool = ThreadPoolExecutor(max_workers=max(1, int(self.concurrency)))
+        self._early_stops = Counter()
+        self._stats_lock = threading.Lock()
+        self._latency = LatencyStats()
+        try:
+            results, elapsed = audit_concurrently(
+                self._plan_jobs(items),
+                lambda job: self._audit_job(job, cache),
+                self.concurrency,
+                self._report_progress,
+                total,
+                self._report_file
+            )
+        finally:
+            if hasattr(self.files_content, 'close'):
+                self.files_content.close()
+            self._chunk_pool.shutdown()
+            if cache:
+                cache.evict()
+                cache.close()
+        self.file_results = results
+        full_report = [results[filepath] for filepath in order if results.get(filepath)]
+        if self.carried:
+            full_report.append(f"♻️ 以下 {len(self.carried)} 条结论沿用上次审计（对应代码未变化）")
+            full_report.extend(self.carried.values())
+
+        # 如果没有发现任何漏洞
+        if not any('[高危]' in report or '[中危]' in report for report in full_report):
+            full_report.append("✅ 未发现高危或中危漏洞")
+
+        full_report.append(self._throughput_summary(len(results), elapsed))
+        if self.triage:
+            full_report.append(
+                f"🧹 静态预筛跳过 {len(skipped)}/{len(order)} 个无风险特征的文件，"
+                f"避免 {len(skipped)} 次模型调用（勾选“全量审计”可关闭预筛）"
+            )
+        if first_result_summary(self._first_result, self._warmup):
+            full_report.append(first_result_summary(self._first_result, self._warmup))
+        if self._latency.summary():
+            full_report.append(self._latency.summary())
+        if get_client().summary():
+            full_report.append(get_client().summary())
+        if early_stop_summary(self._early_stops):
+            full_report.append(early_stop_summary(self._early_stops))
+        if cache:
+            full_report.append(cache.summary())
+        return "\n".join(full_report)
+
+    def _emit(self, message):
+        if self.on_progress:
+            self.on_progress(message)
+
+    def _report_file(self, filepath, entry, done, total):
+        if self.on_event:
+            self.on_event(FileEvent(filepath, entry, done, total))
+
+    def _plan_jobs(self, items):
+        """规划模型请求：批量模式下把小文件打包到同一个提示词中"""
+        if not self.batch_mode:
+            return single_jobs(items)
+        return iter_batches(
+            items,
+            AUDIT_BATCH_TOKEN_BUDGET,
+            AUDIT_BATCH_MAX_FILE_CHARS,
+            overhead_tokens=estimate_tokens(self._generate_batch_prompt(""))
+        )
+
+    def _audit_job(self, job, cache):
+        # 流式来源传来的是惰性引用，在审计线程中才读取文件内容
+        job = [(filepath, resolve(content)) for filepath, content in job]
+        if len(job) == 1:
+            return [self._audit_file(job[0][0], job[0][1], cache)]
+        return self._audit_batch(job, cache)
+
+    def _report_progress(self, filepath, done, total, rate):
+        if self._first_result is None:
+            self._first_result = time.time() - self._started
+        # 提供了 on_event 时逐文件进度由事件汇报（界面汇总后定时刷新），不再逐个文件输出文本
+        if self.on_event is None:
+            self._emit(
+                f"🔍 分析中 {os.path.basename(filepath)}... [{done}/{total}] {rate:.1f} 文件/分钟"
+            )
+
+    def _throughput_summary(self, count, elapsed):
+        return (f"⏱️ 共审计 {count} 个文件，耗时 {elapsed:.1f}s，"
+                f"吞吐 {files_per_minute(count, elapsed):.1f} 文件/分钟（并发 {self.concurrency}）")
+
+    def _audit_file(self, filepath, content, cache=None):
+        """审计单个文件，返回报告条目（无发现时返回 None）"""
+        try:
+            # 检查文件内容是否为空或无法读取
+            if not content or content == UNREADABLE:
+                return f"⚠️ 警告：文件 {filepath} 内容为空或无法读取"
+
+            # 先查缓存，内容未变化的文件直接复用上次的结论
+            cache_key = AuditCache.make_key(content, cache_template(self._generate_prompt("")), OLLAMA_MODEL)
+            analysis_result = cache.get(cache_key) if cache else None
+
+            if analysis_result is None:
+                try:
+                    analysis_result = analyze_in_chunks(
+                        filepath, content, self._generate_prompt, self._request_analysis, self._chunk_pool
+                    )
+                except json.JSONDecodeError:
+                    return f"⚠️ 警告：文件 {filepath} 响应解析失败"
+                except OllamaResponseError:
+                    return f"⚠️ 警告：文件 {filepath} 分析结果格式异常"
+                if cache and TRUNCATED_NOTE not in analysis_result:
+                    cache.put(cache_key, analysis_result)
+
+            # 只有当发现漏洞时才添加到报告
+            return self._format_finding(filepath, analysis_result)
+
+        except requests.RequestException as e:
+            return f"❌ 错误：处理文件 {filepath} 时网络请求失败\n{str(e)}"
+        except Exception as e:
+            return f"❌ 错误：处理文件 {filepath} 时发生未知错误\n{str(e)}"
+
+    def _audit_batch(self, job, cache=None):
+        """批量审计多个小文件，返回与 job 一一对应的报告条目"""
+        template = self._generate_batch_prompt("")
+        verdicts = {}
+        pending = []
+        for filepath, content in job:
+            cached = cache.get(AuditCache.make_key(content, template, OLLAMA_MODEL)) if cache else None
+            if cached is None:
+                pending.append((filepath, content))
+            else:
+                verdicts[filepath] = cached
+
+        if len(pending) == 1:
+            # 只剩一个文件未命中缓存时走单文件审计
+            filepath, content = pending[0]
+            single = self._audit_file(filepath, content, cache)
+            return [single if filepath == path else self._format_finding(path, verdicts[path])
+                    for path, _ in job]
+
+        unassigned = ""
+        if pending:
+            labels = batch_labels([filepath for filepath, _ in pending])
+            try:
+                analysis_result = self._request_analysis(
+                    self._generate_batch_prompt(build_batch_block(pending, labels))
+                )
+            except (json.JSONDecodeError, OllamaResponseError) as e:
+                return [f"⚠️ 警告：文件 {filepath} 批量分析结果解析失败\n{str(e)}" for filepath, _ in job]
+            except requests.RequestException as e:
+                return [f"❌ 错误：处理文件 {filepath} 时网络请求失败\n{str(e)}" for filepath, _ in job]
+
+            per_file, unassigned = split_batch_response(analysis_result, labels)
+            for filepath, content in pending:
+                verdicts[filepath] = per_file[filepath]
+                if cache and not unassigned and TRUNCATED_NOTE not in analysis_result:
+                    cache.put(AuditCache.make_key(content, template, OLLAMA_MODEL), per_file[filepath])
+
+        entries = [self._format_finding(filepath, verdicts[filepath]) for filepath, _ in job]
+        if unassigned and ('[高危]' in unassigned or '[中危]' in unassigned):
+            # 无法确定归属的结论挂在批次的第一个文件上，并列出整个批次
+            names = ", ".join(filepath for filepath, _ in pending)
+            entries[0] = "\n".join(filter(None, [
+                entries[0], f"📄 文件（批量，归属未定）：{names}\n{unassigned}\n{'━'*50}"
+            ]))
+        return entries
+
+    def _request_analysis(self, prompt):
+        """发送审计请求并返回清理后的模型输出（已去除思考过程）"""
+        with self._request_slots:
+            analysis_result, reason = get_client().generate(
+                prompt, timeout=OLLAMA_AUDIT_TIMEOUT, stream=OLLAMA_STREAM,
+                max_chars=AUDIT_STREAM_MAX_CHARS, stats=self._latency
+            )
+        if reason:
+            with self._stats_lock:
+                self._early_stops[reason] += 1
+        return check_truncated(analysis_result, reason)
+
+    def _format_finding(self, filepath, analysis_result):
+        if '[高危]' in analysis_result or '[中危]' in analysis_result or PARTIAL_MARK in analysis_result:
+            return f"📄 文件：{filepath}\n{analysis_result}\n{'━'*50}"
+        return None
+
+    def _generate_prompt(self, content):
+        """生成审计提示"""
+        return f"""{AUDIT_INSTRUCTIONS}
+4. 当前代码（仅限分析）：
+{content}"""
+
+    def _generate_batch_prompt(self, block):
+        """生成多文件批量审计提示"""
+        return f"""{AUDIT_INSTRUCTIONS}   - 本次包含多个文件，每个文件以 "=== FILE: 路径 ===" 开头
+   - 位置必须写成文件标记中的完整路径，例如 admin/user_login.php:32
+   - 没有漏洞的文件不要输出任何内容
+
+4. 当前代码（仅限分析）：
+{block}"""
+
+
+
+class WebshellDetector:
+    """Webshell 检测引擎（不依赖 Qt），接口同 CodeAuditor"""
+
+    def __init__(self, files_content, concurrency=None, use_cache=AUDIT_CACHE_ENABLED, on_progress=None,
+                 on_event=None):
+        self.files_content = files_content
+        self.concurrency = concurrency or default_concurrency()
+        self.use_cache = use_cache
+        self.on_progress = on_progress
+        self.on_event = on_event
+        self.file_results = {}
+
+    def run(self):
+        items, total, order = source_items(self.files_content)
+        self._started = time.time()
+        self._first_result = None
+        self._warmup = warm_up_model(self._emit) if total else None
+
+        cache = AuditCache() if self.use_cache else None
+        self._request_slots = threading.BoundedSemaphore(max(1, int(self.concurrency)))
+        self._chunk_pool = ThreadPoolExecutor(max_workers=max(1, int(self.concurrency)))
+        self._early_stops = Counter()
+        self._stats_lock = threading.Lock()
+        self._latency = LatencyStats()
+        try:
+            results, elapsed = audit_concurrently(
+                single_jobs(items),
+                lambda job: [self._detect_file(job[0][0], resolve(job[0][1]), cache)],
+                self.concurrency,
+                self._report_progress,
+                total,
+                self._report_file
+            )
+        finally:
+            if hasattr(self.files_content, 'close'):
+                self.files_content.close()
+            self._chunk_pool.shutdown()
+            if cache:
+                cache.evict()
+                cache.close()
+        self.file_results = results
+        detection_results = [results[filepath] for filepath in order if results.get(filepath)]
+
+        if not detection_results:
+            detection_results.append("✅ 未发现 Webshell")
+
+        detection_results.append(
+            f"⏱️ 共扫描 {len(results)} 个文件，耗时 {elapsed:.1f}s，"
+            f"吞吐 {files_per_minute(len(results), elapsed):.1f} 文件/分钟（并发 {self.concurrency}）"
+        )
+        if first_result_summary(self._first_result, self._warmup):
+            detection_results.append(first_result_summary(self._first_result, self._warmup))
+        if self._latency.summary():
+            detection_results.append(self._latency.summary())
+        if get_client().summary():
+            detection_results.append(get_client().summary())
+        if early_stop_summary(self._early_stops):
+            detection_results.append(early_stop_summary(self._early_stops))
+        if cache:
+            detection_results.append(cache.summary())
+        return "\n".join(detection_results)
+
+    def _emit(self, message):
+        if self.on_progress:
+            self.on_progress(message)
+
+    def _report_file(self, filepath, entry, done, total):
+        if self.on_event:
+            self.on_event(FileEvent(filepath, entry, done, total))
+
+    def _report_progress(self, filepath, done, total, rate):
+        if self._first_result is None:
+            self._first_result = time.time() - self._started
+        # 提供了 on_event 时逐文件进度由事件汇报（界面汇总后定时刷新），不再逐个文件输出文本
+        if self.on_event is None:
+            self._emit(
+                f"🕵️ 扫描 {os.path.basename(filepath)}... [{done}/{total}] {rate:.1f} 文件/分钟"
+            )
+
+    def _detect_file(self, filepath, content, cache=None):
+        """检测单个文件，返回报告条目（未检测到时返回 None）"""
+        try:
+            # 检查文件内容
+            if not content or content == UNREADABLE:
+                return f"⚠️ 警告：文件 {filepath} 内容为空或无法读取"
+
+            cache_key = AuditCache.make_key(content, cache_template(self._generate_prompt("")), OLLAMA_MODEL)
+            detection_result = cache.get(cache_key) if cache else None
+
+            if detection_result is None:
+                detection_result = analyze_in_chunks(
+                    filepath, content, self._generate_prompt, self._request_detection, self._chunk_pool
+                )
+                if cache and TRUNCATED_NOTE not in detection_result:
+                    cache.put(cache_key, detection_result)
+
+            # 只有检测到 Webshell 时才添加到报告
+            if '🔴 [高危] Webshell' in detection_result or PARTIAL_MARK in detection_result:
+                return f"📁 {filepath}\n{detection_result}\n{'━'*50}"
+
+        except (requests.RequestException, json.JSONDecodeError, OllamaResponseError) as e:
+            return f"❌ 错误：{filepath}\n{str(e)}"
+        return None
+
+    def _request_detection(self, prompt):
+        """发送检测请求并返回清理后的模型输出"""
+        with self._request_slots:
+            detection_result, reason = get_client().generate(
+                prompt, timeout=OLLAMA_WEBSHELL_TIMEOUT, stream=OLLAMA_STREAM,
+                max_chars=AUDIT_STREAM_MAX_CHARS, stats=self._latency
+            )
+        if reason:
+            with self._stats_lock:
+                self._early_stops[reason] += 1
+        return check_truncated(detection_result, reason)
+
+    def _generate_prompt(self, content):
+        """生成 Webshell 检测提示"""
+        return f"""【Webshell检测指令】请严格按以下步骤分析代码：
+
+1. 检测要求：         
+    请分析以下文件内容是否为WebShell或内存马。要求：
+    1. 检查PHP/JSP/ASP等WebShell特征（如加密函数、执行系统命令、文件操作）
+    2. 识别内存马特征（如无文件落地、进程注入、异常网络连接）
+    3. 分析代码中的可疑功能（如命令执行、文件上传、信息收集）
+    4. 检查混淆编码、加密手段等规避技术
+
+2. 判断规则：
+   - 仅当确认恶意性时报告
+   - 输出格式：🔴 [高危] Webshell - 文件名:行号 - 检测到[特征1+特征2+...]
+
+3. 输出示例（严格按照此格式输出，不要有任何的补充，如果未检测到危险，则不输出）：
+   🔴 [高危] Webshell - malicious.php:8 - 检测到[system执行+base64解码+错误抑制]
+
+4. 待分析代码：
+{content}""" 
\ No newline at end of file
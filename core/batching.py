@@ -0,0 +1,108 @@
+import os
+import re
+
+FILE_MARKER = "=== FILE: {} ==="
+_MARKER_RE = re.compile(r'^\s*=+\s*FILE:\s*(.+?)\s*=+\s*$')
+
+
+def estimate_tokens(text):
+    """粗略估算 token 数（代码文本约 4 字符 / token）"""
+    return len(text) // 4 + 1
+
+
+def batch_labels(paths):
+    """为批次中的文件生成提示词中的标记名（相对于公共目录的路径）"""
+    if len(paths) == 1:
+        return {paths[0]: os.path.basename(paths[0])}
+    try:
+        base = os.path.commonpath([os.path.dirname(p) for p in paths])
+    except ValueError:
+        base = ""
+    return {p: os.path.relpath(p, base).replace('\\', '/') if base else p for p in paths}
+
+
+def iter_batches(items, token_budget, max_file_chars, overhead_tokens=0):
+    """把小文件按 token 预算打包成批次，边读入边产出（items 可以是流式来源）
+
+    超过 max_file_chars 的文件、空文件单独成批，保持原有的单文件审计路径。
+    """
+    batch = []
+    used = overhead_tokens
+    for filepath, content in items:
+        if not content or len(content) > max_file_chars:
+            yield [(filepath, content)]
+            continue
+
+        cost = estimate_tokens(FILE_MARKER.format(filepath)) + estimate_tokens(content)
+        if batch and used + cost > token_budget:
+            yield batch
+            batch = []
+            used = overhead_tokens
+        batch.append((filepath, content))
+        used += cost
+    if batch:
+        yield batch
+
+
+def pack_batches(items, token_budget, max_file_chars, overhead_tokens=0):
+    """把小文件按 token 预算打包成批次
+
+    items 为 [(filepath, content), ...]，返回 [[(filepath, content), ...], ...]。
+    """
+    return list(iter_batches(items, token_budget, max_file_chars, overhead_tokens))
+
+
+def build_batch_block(files, labels):
+    """把多个文件拼成带文件标记的代码块"""
+    parts = []
+    for filepath, content in files:
+        parts.append(FILE_MARKER.format(labels[filepath]))
+        parts.append(content)
+    return "\n".join(parts)
+
+
+def _match_label(line, labels):
+    """按最长路径后缀匹配结论行所属的文件，无法唯一确定时返回 None"""
+    normalized = line.replace('\\', '/')
+    best, best_score, tie = None, 0, False
+    for filepath, label in labels.items():
+        parts = label.split('/')
+        for k in range(len(parts), 0, -1):
+            suffix = '/'.join(parts[-k:])
+            if re.search(r'(^|[\s/(\[`"\'])' + re.escape(suffix) + r'(?=[:\s)\]`"\'，,]|$)', normalized):
+                if k > best_score:
+                    best, best_score, tie = filepath, k, False
+                elif k == best_score:
+                    tie = True
+                break
+    return None if tie else best
+
+
+def split_batch_response(text, labels):
+    """把批量审计的模型输出拆回到各个文件
+
+    返回 (per_file, unassigned)：per_file 为 {filepath: 结论文本}，
+    unassigned 为无法确定归属的行。[POC] 等续行跟随上一条结论归属。
+    """
+    per_file = {filepath: [] for filepath in labels}
+    label_to_path = {label: filepath for filepath, label in labels.items()}
+    unassigned = []
+    section = None  # 模型回显的文件标记
+    current = None
+
+    for line in text.splitlines():
+        marker = _MARKER_RE.match(line)
+        if marker:
+            section = current = label_to_path.get(marker.group(1).strip())
+            continue
+
+        if '[高危]' in line or '[中危]' in line:
+            current = _match_label(line, labels) or section
+        if not line.strip():
+            continue
+        if current is None:
+            unassigned.append(line)
+        else:
+            per_file[current].append(line)
+
+    return {filepath: "\n".join(lines) for filepath, lines in per_file.items()}, "\n".join(unassigned)
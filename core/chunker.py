@@ -0,0 +1,101 @@
+import re
+from collections import namedtuple
+
+Chunk = namedtuple('Chunk', ['index', 'total', 'start_line', 'end_line', 'lines'])
+
+# 函数/类定义的起始行，优先在这些位置切分
+_DEFINITION_RE = re.compile(
+    r'^\s*(?:@\w+|(?:(?:public|private|protected|static|final|abstract|async|export|default)\s+)*'
+    r'(?:function\b|def\s|class\s|interface\s|trait\s|sub\s)|(?:public|private|protected)\b[^;=]*\()'
+)
+_FINDING_RE = re.compile(r'\[(高危|中危)\]\s*([^-\n]*?)\s*-\s*[^\s:]*:(\d+)')
+
+PARTIAL_MARK = "⚠️ 文件过大"
+PARTIAL_NOTE = PARTIAL_MARK + "，仅审计了第 1-{} 行"
+
+
+def chunk_signature(max_chars, overlap_lines, max_chunks):
+    """分片参数签名，参与缓存键计算，参数或切分方式变化后旧结论自动失效"""
+    return f"chunk2:{max_chars}/{overlap_lines}/{max_chunks}"
+
+
+def _segments(content, max_chars):
+    """按行切分内容，超长行（如压缩后的 JS）再按字符切开，保留真实行号"""
+    segments = []
+    for lineno, line in enumerate(content.splitlines(), 1):
+        if len(line) <= max_chars:
+            segments.append((lineno, line))
+        else:
+            for i in range(0, len(line), max_chars):
+                segments.append((lineno, line[i:i + max_chars]))
+    return segments
+
+
+def _best_boundary(segments, start, end):
+    """在窗口后部寻找切分点：优先函数/类定义，其次空行"""
+    floor = start + max(1, (end - start) * 2 // 3)
+    for pattern in (_DEFINITION_RE, None):
+        for i in range(end, floor - 1, -1):
+            text = segments[i][1]
+            if (pattern.match(text) if pattern else not text.strip()):
+                return i
+    return end
+
+
+def split_into_chunks(content, max_chars, overlap_lines=10, max_chunks=0):
+    """把大文件切成带重叠的窗口
+
+    返回 (chunks, truncated)。文件不超过 max_chars 时只有一个分片；相邻分片重叠 overlap_lines 行，
+    但最多为窗口的 1/4。
+    max_chunks > 0 时最多返回 max_chunks 个分片，truncated 表示是否有剩余内容未覆盖。
+    """
+    segments = _segments(content, max_chars)
+    windows = []
+    start = 0
+    while start < len(segments):
+        size = 0
+        end = start
+        while end < len(segments) and size + len(segments[end][1]) + 1 <= max_chars:
+            size += len(segments[end][1]) + 1
+            end += 1
+        if end == start:
+            end = start + 1
+        if end < len(segments):
+            end = _best_boundary(segments, start, end)
+        windows.append(segments[start:end])
+        if end >= len(segments):
+            break
+        if max_chunks and len(windows) >= max_chunks:
+            return [Chunk(i, len(windows), w[0][0], w[-1][0], w) for i, w in enumerate(windows, 1)], True
+        # 重叠不超过窗口的 1/4：长行文件一个窗口只有十来行时，固定重叠会让每次只前进一行
+        start = max(end - min(overlap_lines, (end - start) // 4), start + 1)
+
+    return [Chunk(i, len(windows), w[0][0], w[-1][0], w) for i, w in enumerate(windows, 1)], False
+
+
+def render_chunk(chunk, filename):
+    """生成带真实行号的分片文本"""
+    lines = [f"=== 代码片段 {chunk.index}/{chunk.total}：{filename} 第 {chunk.start_line}-{chunk.end_line} 行"
+             f"（行首数字为文件中的真实行号）==="]
+    lines.extend(f"{lineno:>5} | {text}" for lineno, text in chunk.lines)
+    return "\n".join(lines)
+
+
+def merge_findings(verdicts):
+    """合并各分片的结论，去除重叠区域产生的重复漏洞（按 等级+类型+行号 判重）"""
+    merged = []
+    seen = set()
+    keep = False
+    for verdict in verdicts:
+        for line in verdict.splitlines():
+            if not line.strip():
+                continue
+            if '[高危]' in line or '[中危]' in line:
+                match = _FINDING_RE.search(line)
+                key = match.groups() if match else line.strip()
+                keep = key not in seen
+                seen.add(key)
+            # [POC] 等续行跟随其上方的结论一起保留或丢弃
+            if keep:
+                merged.append(line)
+    return "\n".join(merged)
@@ -0,0 +1,138 @@
+"""命令行扫描入口（不依赖 PyQt5，可在服务器或定时任务中运行）
+
+    python -m core.cli scan <目录> --types .php,.js --out report.json
+
+退出码：0 未发现达到 --fail-on 等级的问题，1 运行出错（含请求失败），2 参数错误，3 存在中危，4 存在高危。
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+from core.findings import build_records
+
+EXIT_OK = 0
+EXIT_ERROR = 1
+EXIT_MEDIUM = 3
+EXIT_HIGH = 4
+
+DEFAULT_TYPES = ".php,.jsp,.java,.py,.js,.asp,.aspx"
+
+
+def exit_code(findings, problems, fail_on):
+    """按最高风险等级返回退出码；有文件请求失败时不能判定为安全"""
+    severities = {finding['severity'] for finding in findings}
+    if fail_on != 'none' and 'high' in severities:
+        return EXIT_HIGH
+    if fail_on == 'medium' and 'medium' in severities:
+        return EXIT_MEDIUM
+    if any(problem['message'].startswith('❌') for problem in problems):
+        return EXIT_ERROR
+    return EXIT_OK
+
+
+def write_report(report, findings, problems, out, fmt, text_report=""):
+    """输出报告：json 为单个对象，jsonl 每行一条记录（最后一行为汇总），text 为界面中的文本报告"""
+    stream = open(out, 'w', encoding='utf-8') if out and out != '-' else sys.stdout
+    try:
+        if fmt == 'text':
+            stream.write(text_report + "\n")
+        elif fmt == 'jsonl':
+            for finding in findings:
+                stream.write(json.dumps(dict(finding, record='finding'), ensure_ascii=False) + "\n")
+            for problem in problems:
+                stream.write(json.dumps(dict(problem, record='error'), ensure_ascii=False) + "\n")
+            stream.write(json.dumps(dict(report, record='summary'), ensure_ascii=False) + "\n")
+        else:
+            json.dump(dict(report, findings=findings, errors=problems), stream, ensure_ascii=False, indent=2)
+            stream.write("\n")
+    finally:
+        if stream is not sys.stdout:
+            stream.close()
+
+
+def scan(args):
+    if not os.path.isdir(args.directory):
+        print(f"❌ 目录不存在: {args.directory}", file=sys.stderr)
+        return EXIT_ERROR
+
+    extensions = tuple(ext.strip() if ext.strip().startswith('.') else f".{ext.strip()}"
+                       for ext in args.types.split(',') if ext.strip())
+    progress = None if args.quiet else (lambda message: print(message, file=sys.stderr))
+
+    # 审计引擎放在这里导入，保证 --help 等命令启动足够快
+    from config import WALK_EXCLUDE_DIRS
+    from core.auditor import CodeAuditor, WebshellDetector
+    from core.pipeline import FileSource
+    exclude_dirs = list(WALK_EXCLUDE_DIRS) + [name.strip() for name in args.exclude.split(',') if name.strip()]
+    source = FileSource(args.directory, extensions, use_index=not args.no_index,
+                        exclude_dirs=exclude_dirs, gitignore=not args.no_gitignore)
+    if args.mode == 'webshell':
+        engine = WebshellDetector(source, args.concurrency, not args.no_cache, on_progress=progress)
+    else:
+        engine = CodeAuditor(source, args.concurrency, not args.no_cache, args.batch,
+                             not args.all, on_progress=progress)
+
+    start = time.time()
+    text_report = engine.run()
+    if progress:
+        for line in source.index_summary():
+            progress(line)
+    findings, problems = build_records(source.paths, engine.file_results)
+    reported = {problem['file'] for problem in problems}
+    problems.extend({'file': path, 'message': f"❌ 无法读取: {error}"}
+                    for path, error in source.errors if path not in reported)
+
+    report = {
+        'target': os.path.abspath(args.directory),
+        'mode': args.mode,
+        'files': source.matched,
+        'elapsed': round(time.time() - start, 2),
+        'high': sum(1 for finding in findings if finding['severity'] == 'high'),
+        'medium': sum(1 for finding in findings if finding['severity'] == 'medium'),
+        'error_count': len(problems),
+    }
+    write_report(report, findings, problems, args.out, args.format, text_report)
+    return exit_code(findings, problems, args.fail_on)
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog='python -m core.cli',
+        description='无界面的代码审计 / Webshell 扫描',
+        epilog='退出码：0 无问题，1 运行出错，2 参数错误，3 存在中危，4 存在高危',
+    )
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    scan_parser = commands.add_parser('scan', help='扫描本地目录')
+    scan_parser.add_argument('directory', help='要扫描的目录')
+    scan_parser.add_argument('--types', default=DEFAULT_TYPES, help=f'文件扩展名，逗号分隔（默认 {DEFAULT_TYPES}）')
+    scan_parser.add_argument('--exclude', default='', help='额外排除的目录名，逗号分隔（在默认排除目录之外）')
+    scan_parser.add_argument('--no-gitignore', action='store_true', help='不跳过 .gitignore 中忽略的文件')
+    scan_parser.add_argument('--no-index', action='store_true', help='不使用文件索引（每次都完整检查所有文件）')
+    scan_parser.add_argument('--mode', choices=['audit', 'webshell'], default='audit', help='审计模式（默认 audit）')
+    scan_parser.add_argument('--out', help='报告输出文件（默认标准输出）')
+    scan_parser.add_argument('--format', choices=['json', 'jsonl', 'text'], default='json',
+                             help='报告格式（默认 json）')
+    scan_parser.add_argument('--fail-on', choices=['high', 'medium', 'none'], default='medium',
+                             help='达到该等级时返回非零退出码（默认 medium）')
+    scan_parser.add_argument('--concurrency', type=int, help='并发请求数（默认按 Ollama 节点配置）')
+    scan_parser.add_argument('--batch', action='store_true', help='小文件批量审计')
+    scan_parser.add_argument('--all', action='store_true', help='全量审计（跳过静态预筛）')
+    scan_parser.add_argument('--no-cache', action='store_true', help='不使用审计结果缓存')
+    scan_parser.add_argument('-q', '--quiet', action='store_true', help='不输出进度')
+    scan_parser.set_defaults(func=scan)
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    try:
+        return args.func(args)
+    except KeyboardInterrupt:
+        return EXIT_ERROR
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,112 @@
+import hashlib
+import mmap
+import os
+import threading
+from collections import namedtuple
+
+from config import CONTENT_MMAP_MIN_BYTES, WALK_MAX_FILE_BYTES
+from core.archive import ArchiveReader, ARCHIVE_ERRORS, is_virtual
+
+UNREADABLE = "无法读取文件内容"
+
+FileMeta = namedtuple('FileMeta', ['size', 'mtime', 'sha256'])
+
+
+class ContentRef:
+    """文件内容的惰性引用：只保存路径和大小，需要内容时才读取
+
+    len() 返回文件字节数（用于批量打包等只需要大小的场合），read() 读取文本。
+    """
+
+    __slots__ = ('store', 'path', 'size')
+
+    def __init__(self, store, path, size):
+        self.store = store
+        self.path = path
+        self.size = size
+
+    def __len__(self):
+        return self.size
+
+    def read(self):
+        return self.store.read(self.path)
+
+
+def resolve(content):
+    """把惰性引用换成文本，普通字符串原样返回"""
+    return content.read() if isinstance(content, ContentRef) else content
+
+
+class ContentStore:
+    """惰性文件内容存储：只记录路径、大小、修改时间和内容哈希，不缓存文件正文
+
+    内容在审计线程中按需读取，用完即释放；大文件通过 mmap 直接解码，避免多一份字节拷贝。
+    压缩包内的文件（虚拟路径 app.war!/WEB-INF/x.jsp）直接从包中解压到内存读取，解压超过 max_member_bytes 的跳过。
+    读取失败的文件记入 errors，读取结果为 UNREADABLE。
+    """
+
+    def __init__(self, mmap_min_bytes=CONTENT_MMAP_MIN_BYTES, max_member_bytes=WALK_MAX_FILE_BYTES):
+        self.mmap_min_bytes = mmap_min_bytes
+        self.meta = {}  # {路径: FileMeta}，sha256 在首次读取后填充
+        self.errors = []  # [(路径, 错误信息)]
+        self.archives = ArchiveReader(max_size=max_member_bytes)
+        self._lock = threading.Lock()
+
+    def add(self, path, size=None, mtime=None, sha256=None):
+        """登记文件并返回惰性引用，无法访问时返回 None（遍历时已取得 size/mtime 则不再 stat）
+
+        sha256 为文件索引中记录的内容哈希（文件未变化时），读取后以实际内容的哈希为准。
+        """
+        if size is None:
+            try:
+                stat = os.stat(path)
+            except OSError as e:
+                with self._lock:
+                    self.errors.append((path, str(e)))
+                return None
+            size, mtime = stat.st_size, stat.st_mtime
+        with self._lock:
+            self.meta[path] = FileMeta(size, mtime, sha256)
+        return ContentRef(self, path, size)
+
+    def read(self, path):
+        """读取文件文本（UTF-8），同时记录内容哈希"""
+        try:
+            if is_virtual(path):
+                data = self.archives.read(path)
+                size = len(data)
+                digest = hashlib.sha256(data).hexdigest()
+                text = data.decode('utf-8')
+            else:
+                with open(path, 'rb') as f:
+                    size = os.fstat(f.fileno()).st_size
+                    if size >= self.mmap_min_bytes:
+                        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                            digest = hashlib.sha256(mapped).hexdigest()
+                            text = str(mapped, 'utf-8')
+                    else:
+                        data = f.read()
+                        digest = hashlib.sha256(data).hexdigest()
+                        text = data.decode('utf-8')
+        except (ValueError,) + ARCHIVE_ERRORS as e:
+            # UnicodeDecodeError 是 ValueError 的子类，ARCHIVE_ERRORS 已包含 OSError
+            with self._lock:
+                self.errors.append((path, str(e)))
+            return UNREADABLE
+        with self._lock:
+            meta = self.meta.get(path)
+            self.meta[path] = FileMeta(size, meta.mtime if meta else None, digest)
+        return text
+
+    def sha256(self, path):
+        meta = self.meta.get(path)
+        return meta.sha256 if meta else None
+
+    def close(self):
+        """关闭读取压缩包时保持打开的文件（之后仍可继续读取，会重新打开）"""
+        self.archives.close()
+
+    def hashes(self):
+        """已知内容哈希的文件 {路径: FileMeta}（快照，可在审计线程仍在读取时调用）"""
+        with self._lock:
+            return {path: meta for path, meta in self.meta.items() if meta.sha256}
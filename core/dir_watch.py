@@ -0,0 +1,127 @@
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import threading
+
+# inotify 事件掩码（见 <sys/inotify.h>）
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+
+_CHILD_EVENTS = IN_CREATE | IN_DELETE | IN_MOVED_FROM | IN_MOVED_TO
+_SELF_GONE = IN_DELETE_SELF | IN_MOVE_SELF | IN_IGNORED
+_EVENT_HEADER = struct.Struct('iIII')  # wd, mask, cookie, len
+
+
+def list_subdirs(path):
+    """目录下的直接子目录名集合"""
+    with os.scandir(path) as it:
+        return {entry.name for entry in it if entry.is_dir()}
+
+
+def _load_inotify():
+    """加载 libc 中的 inotify 接口，非 Linux 或不可用时返回 None"""
+    if not os.path.exists('/proc/sys/fs/inotify'):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+        libc.inotify_init1.argtypes = [ctypes.c_int]
+        libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        return libc
+    except (OSError, AttributeError):
+        return None
+
+
+class DirectoryWatcher:
+    """监听目录的直接子项增删
+
+    Linux 上使用 inotify，空闲时阻塞在 select 上不占 CPU，变化在毫秒级内返回；
+    inotify 不可用（其他平台、watch 数量耗尽、目录被删除后）时退回按 poll_interval 轮询。
+    wait() 在目录可能有变化时返回 True，close() 后返回 False，调用方自行重新列目录比对。
+    """
+
+    def __init__(self, path, poll_interval=1.0, debounce=0.05):
+        self.path = path
+        self.poll_interval = poll_interval
+        self.debounce = debounce  # 收到事件后再等待的秒数，把批量增删合并为一次通知
+        self.mode = 'poll'
+        self._fd = None
+        self._closed = threading.Event()
+        self._wake_r, self._wake_w = os.pipe()  # close() 通过管道唤醒阻塞中的 select
+
+        libc = _load_inotify()
+        if libc is not None:
+            fd = libc.inotify_init1(os.O_NONBLOCK | getattr(os, 'O_CLOEXEC', 0))
+            if fd >= 0:
+                mask = _CHILD_EVENTS | IN_DELETE_SELF | IN_MOVE_SELF | IN_ONLYDIR
+                if libc.inotify_add_watch(fd, os.fsencode(path), mask) >= 0:
+                    self._fd = fd
+                    self.mode = 'inotify'
+                else:
+                    os.close(fd)
+
+    def _drain(self):
+        """读出所有待处理事件，返回 (是否有子项变化, 被监听目录是否已失效)"""
+        changed = gone = False
+        while True:
+            try:
+                data = os.read(self._fd, 65536)
+            except BlockingIOError:
+                return changed, gone
+            offset = 0
+            while offset + _EVENT_HEADER.size <= len(data):
+                _, mask, _, length = _EVENT_HEADER.unpack_from(data, offset)
+                offset += _EVENT_HEADER.size + length
+                changed = changed or bool(mask & (_CHILD_EVENTS | IN_Q_OVERFLOW))
+                gone = gone or bool(mask & _SELF_GONE)
+
+    def _fall_back_to_polling(self):
+        os.close(self._fd)
+        self._fd = None
+        self.mode = 'poll'
+
+    def _release(self):
+        for fd in (self._fd, self._wake_r, self._wake_w):
+            if fd is not None:
+                os.close(fd)
+        self._fd = self._wake_r = self._wake_w = None
+
+    def wait(self):
+        while not self._closed.is_set():
+            if self._fd is None:
+                if not self._closed.wait(self.poll_interval):
+                    return True
+                break
+
+            select.select([self._fd, self._wake_r], [], [])
+            if self._closed.is_set():
+                break
+            changed, gone = self._drain()
+            # 合并紧随其后的事件（如一次删除多个项目、解压出多个目录）
+            while select.select([self._fd], [], [], self.debounce)[0]:
+                more, lost = self._drain()
+                changed, gone = changed or more, gone or lost
+            if gone:
+                self._fall_back_to_polling()
+                return True
+            if changed:
+                return True
+        self._release()
+        return False
+
+    def close(self):
+        """停止监听，正在阻塞的 wait() 立即返回 False（可在其他线程调用）"""
+        self._closed.set()
+        try:
+            os.write(self._wake_w, b'\0')
+        except (OSError, TypeError):
+            # wait() 已经退出并释放了管道
+            pass
@@ -0,0 +1,200 @@
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+
+from config import FILE_INDEX_DIR, ARCHIVE_SCAN_ENABLED, WALK_MAX_FILE_BYTES
+from core.archive import ARCHIVE_SEPARATOR, iter_archive
+from core.walker import walk_files, WalkEntry, WalkStats
+
+
+def index_path(root, index_dir=FILE_INDEX_DIR):
+    """项目索引文件的位置（按项目绝对路径区分）"""
+    key = hashlib.sha1(os.path.realpath(root).encode('utf-8', errors='replace')).hexdigest()[:16]
+    return os.path.join(index_dir, f"{os.path.basename(os.path.realpath(root)) or 'root'}-{key}.db")
+
+
+class FileIndex:
+    """单个项目的持久化文件索引
+
+    以相对路径为键记录文件的大小、修改时间和内容哈希。每次扫描仍会遍历目录，
+    但大小和修改时间未变化的文件不再读取（跳过二进制检查，沿用上次的内容哈希），
+    重扫未变化的项目只需目录遍历和 stat。内容哈希在文件被读取时由 ContentStore 计算，
+    扫描结束后通过 record_hashes 写回。
+    压缩包内的文件以虚拟路径（app.war!/WEB-INF/x.jsp）记录，包本身未变化时直接沿用上次列出的清单，不再打开。
+    """
+
+    def __init__(self, root, db_path=None):
+        self.root = root
+        self.prefix = os.path.join(root, '')
+        self.db_path = db_path or index_path(root)
+        self.added = []  # 本次新增的文件
+        self.modified = []  # 大小或修改时间变化的文件
+        self.removed = []  # 本次遍历中已不存在（或已被排除）的文件
+        self.unchanged = 0
+        self.sha256 = {}  # {路径: 内容哈希}，仅包含未变化且已有哈希的文件
+        self._recorded = set()
+        self._lock = threading.Lock()
+
+        os.makedirs(os.path.dirname(os.path.abspath(self.db_path)), exist_ok=True)
+        # 遍历线程写入文件列表，审计线程写回哈希，由 _lock 串行化访问
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS files (
+                path TEXT PRIMARY KEY,
+                ext TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                mtime REAL NOT NULL,
+                sha256 TEXT,
+                indexed_at REAL NOT NULL
+            )
+        """)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_files_ext ON files(ext)")
+        # 已展开的压缩包，suffixes 为上次列出包内文件时使用的扩展名（逗号分隔）
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS archives (
+                path TEXT PRIMARY KEY,
+                size INTEGER NOT NULL,
+                mtime REAL NOT NULL,
+                suffixes TEXT NOT NULL
+            )
+        """)
+        self._conn.commit()
+
+    def _rows(self, suffixes):
+        marks = ','.join('?' * len(suffixes))
+        with self._lock:
+            return {
+                path: (size, mtime, sha256)
+                for path, size, mtime, sha256 in self._conn.execute(
+                    f"SELECT path, size, mtime, sha256 FROM files WHERE ext IN ({marks})", tuple(suffixes)
+                )
+            }
+
+    def _archive_rows(self):
+        with self._lock:
+            return {
+                path: (size, mtime, set(suffixes.split(',')))
+                for path, size, mtime, suffixes in self._conn.execute(
+                    "SELECT path, size, mtime, suffixes FROM archives"
+                )
+            }
+
+    def refresh(self, extensions, stats=None, **walk_options):
+        """遍历项目并增量更新索引，按遍历顺序产出 WalkEntry
+
+        只有新增或变化的文件会被写入；遍历完整结束时才删除消失的文件，中途停止不会误删。
+        walk_options 原样传给 core.walker.walk_files。
+        """
+        suffixes = sorted({ext.lower() for ext in extensions})
+        stats = stats if stats is not None else WalkStats()
+        rows = self._rows(suffixes)
+        known = {self.prefix + path: (size, mtime) for path, (size, mtime, _) in rows.items()}
+        self.added, self.modified, self.removed, self.unchanged, self.sha256 = [], [], [], 0, {}
+        changes = []
+        seen = set()
+
+        use_archives = walk_options.get('archives', ARCHIVE_SCAN_ENABLED)
+        archive_rows = self._archive_rows() if use_archives else {}
+        members = {}  # {压缩包相对路径: [包内文件的相对虚拟路径]}
+        for path in rows:
+            if ARCHIVE_SEPARATOR in path:
+                members.setdefault(path.split(ARCHIVE_SEPARATOR, 1)[0], []).append(path)
+        archive_changes = []
+        seen_archives = set()
+
+        def expand(archive):
+            path = archive.path[len(self.prefix):]
+            seen_archives.add(path)
+            row = archive_rows.get(path)
+            if row and row[:2] == (archive.size, archive.mtime) and row[2].issuperset(suffixes):
+                # 包未变化且上次已按这些扩展名列出过：沿用清单，不打开压缩包
+                for member in sorted(members.get(path, [])):
+                    size, mtime, _ = rows[member]
+                    yield WalkEntry(self.prefix + member, size, mtime)
+                return
+            errors = len(stats.archive_errors)
+            yield from iter_archive(archive.path, suffixes, walk_options.get('max_size', WALK_MAX_FILE_BYTES),
+                                    archive.mtime, stats=stats, errors=stats.archive_errors)
+            # 包（或其中嵌套的包）无法打开时不记录清单，下次重新展开并再次报告错误
+            if len(stats.archive_errors) == errors:
+                listed = set(suffixes) | (row[2] if row and row[:2] == (archive.size, archive.mtime) else set())
+                archive_changes.append((path, archive.size, archive.mtime, ','.join(sorted(listed))))
+
+        completed = False
+        try:
+            for entry in walk_files(self.root, suffixes, stats=stats, known=known, expand=expand, **walk_options):
+                path = entry.path[len(self.prefix):]
+                seen.add(path)
+                row = rows.get(path)
+                if row is None or row[:2] != (entry.size, entry.mtime):
+                    (self.added if row is None else self.modified).append(entry.path)
+                    changes.append((path, os.path.splitext(path)[1].lower(), entry.size, entry.mtime))
+                else:
+                    self.unchanged += 1
+                    if row[2]:
+                        self.sha256[entry.path] = row[2]
+                yield entry
+            completed = True
+        finally:
+            removed = [path for path in rows if path not in seen] if completed else []
+            removed_archives = [path for path in archive_rows if path not in seen_archives] if completed else []
+            self.removed = [self.prefix + path for path in removed]
+            now = time.time()
+            with self._lock:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO files (path, ext, size, mtime, sha256, indexed_at) "
+                    "VALUES (?, ?, ?, ?, NULL, ?)",
+                    [change + (now,) for change in changes]
+                )
+                self._conn.executemany("DELETE FROM files WHERE path = ?", [(path,) for path in removed])
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO archives (path, size, mtime, suffixes) VALUES (?, ?, ?, ?)",
+                    archive_changes
+                )
+                self._conn.executemany("DELETE FROM archives WHERE path = ?", [(path,) for path in removed_archives])
+                self._conn.commit()
+
+    def files(self, extensions=None):
+        """不遍历目录，直接返回索引中的文件 [(路径, 大小, 修改时间, 内容哈希)]，按路径排序"""
+        query = "SELECT path, size, mtime, sha256 FROM files"
+        params = ()
+        if extensions:
+            params = tuple(sorted({ext.lower() for ext in extensions}))
+            query += f" WHERE ext IN ({','.join('?' * len(params))})"
+        with self._lock:
+            rows = self._conn.execute(query + " ORDER BY path", params).fetchall()
+        return [(self.prefix + path, size, mtime, sha256) for path, size, mtime, sha256 in rows]
+
+    def record_hashes(self, meta):
+        """写回读取时算出的内容哈希，meta 为 {路径: FileMeta}
+
+        只更新大小和修改时间与索引一致的记录，避免把扫描期间被改动的文件记成旧哈希。
+        """
+        updates = [
+            (file_meta.sha256, path[len(self.prefix):], file_meta.size, file_meta.mtime)
+            for path, file_meta in meta.items()
+            if path.startswith(self.prefix) and file_meta.sha256 and file_meta.mtime is not None
+            and self.sha256.get(path) != file_meta.sha256 and path not in self._recorded
+        ]
+        if not updates:
+            return 0
+        with self._lock:
+            self._conn.executemany(
+                "UPDATE files SET sha256 = ? WHERE path = ? AND size = ? AND mtime = ?", updates
+            )
+            self._conn.commit()
+        self._recorded.update(self.prefix + update[1] for update in updates)
+        return len(updates)
+
+    def summary(self):
+        """本次刷新的变化统计"""
+        return (
+            f"🗂️ 文件索引 {os.path.basename(os.path.normpath(self.root)) or self.root}："
+            f"新增 {len(self.added)}，变化 {len(self.modified)}，删除 {len(self.removed)}，未变化 {self.unchanged}"
+        )
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,94 @@
+import re
+from collections import namedtuple
+
+_FINDING_RE = re.compile(r'\[(高危|中危)\]\s*([^-\n]*?)\s*-\s*([^\s:]*)(?::(\d+))?\s*(?:-\s*(.*))?$')
+_SEVERITY = {'高危': 'high', '中危': 'medium'}
+
+# 引擎每完成一个文件产生的事件：路径、报告条目（无发现为 None）、已完成文件数、当前已知文件总数
+FileEvent = namedtuple('FileEvent', ['path', 'entry', 'done', 'total'])
+
+
+def parse_findings(filepath, entry):
+    """把一个文件的报告条目拆成结构化的漏洞列表（[POC] 续行归入上一条）"""
+    findings = []
+    for line in entry.splitlines():
+        match = _FINDING_RE.search(line)
+        if match:
+            severity, kind, location, lineno, description = match.groups()
+            findings.append({
+                'file': filepath,
+                'severity': _SEVERITY[severity],
+                'type': kind.strip(),
+                'location': location,
+                'line': int(lineno) if lineno else None,
+                'description': (description or '').strip(),
+                'poc': '',
+            })
+        elif findings and not line.startswith(('📄', '📁', '━')):
+            poc = line[len('[POC]'):] if line.startswith('[POC]') else line
+            findings[-1]['poc'] = "\n".join(filter(None, [findings[-1]['poc'], poc]))
+    return findings
+
+
+def build_records(filepaths, file_results):
+    """按文件顺序从各文件的报告条目生成 (漏洞列表, 警告/错误列表)"""
+    findings = []
+    problems = []
+    for filepath in filepaths:
+        entry = file_results.get(filepath)
+        if not entry:
+            continue
+        if entry.startswith(('❌', '⚠️ 警告')):
+            problems.append({'file': filepath, 'message': entry})
+            continue
+        findings.extend(parse_findings(filepath, entry))
+    return findings, problems
+
+
+class FindingsModel:
+    """扫描结果的增量统计（不依赖 Qt）
+
+    每个 FileEvent 只解析对应文件的报告条目，计数和进度逐个事件累加，
+    任何时候读取都不需要回头扫描整份报告文本。
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.done = 0
+        self.total = 0
+        self.high = 0
+        self.medium = 0
+        self.errors = 0
+        self.reported = set()  # 已记录警告/错误的文件
+
+    def apply(self, event):
+        """计入一个文件完成事件，返回该文件的 (漏洞列表, 警告/错误列表)"""
+        self.done = max(self.done, event.done)
+        self.total = max(self.total, event.total, self.done)
+        return self.add(event.path, event.entry)
+
+    def add(self, filepath, entry):
+        """计入一个报告条目（不影响进度，如增量审计沿用的上次结论），返回 (漏洞列表, 警告/错误列表)"""
+        findings, problems = build_records([filepath], {filepath: entry})
+        for finding in findings:
+            if finding['severity'] == 'high':
+                self.high += 1
+            else:
+                self.medium += 1
+        if problems:
+            self.errors += len(problems)
+            self.reported.add(filepath)
+        return findings, problems
+
+    def add_error(self, filepath, message):
+        """计入引擎之外的错误（如遍历时无法读取的文件），已记录过的文件不重复计数"""
+        if filepath in self.reported:
+            return None
+        self.errors += 1
+        self.reported.add(filepath)
+        return {'file': filepath, 'message': message}
+
+    def percent(self):
+        return int(self.done * 100 / self.total) if self.total else 0
@@ -0,0 +1,232 @@
+import hashlib
+import json
+import os
+import re
+import subprocess
+import time
+from collections import namedtuple
+
+from config import INCREMENTAL_STATE_DIR
+from core.archive import outer_path
+
+IncrementalPlan = namedtuple('IncrementalPlan', ['head_sha', 'to_audit', 'carried', 'message'])
+
+_HUNK_RE = re.compile(r'^@@ -\d+(?:,\d+)? \+(\d+)(?:,(\d+))? @@')
+
+
+def _git(project_dir, *args):
+    """在项目目录下执行 git 命令，失败时返回 None"""
+    try:
+        result = subprocess.run(
+            ['git', '-c', 'core.quotepath=off', *args],
+            cwd=project_dir, capture_output=True, text=True, encoding='utf-8', errors='replace'
+        )
+    except OSError:
+        return None
+    return result.stdout if result.returncode == 0 else None
+
+
+def _state_path(project_dir):
+    project_dir = os.path.abspath(project_dir)
+    digest = hashlib.sha1(project_dir.encode('utf-8')).hexdigest()[:10]
+    return os.path.join(INCREMENTAL_STATE_DIR, f"{os.path.basename(project_dir)}-{digest}.json")
+
+
+def load_state(project_dir):
+    """读取项目上次审计的提交和结论"""
+    try:
+        with open(_state_path(project_dir), 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def merge_entries(new_entry, old_entry):
+    """保存状态时合并同一文件的结论：本次审计过的文件只有新结论，未变化的文件沿用旧结论"""
+    if not new_entry or not old_entry or old_entry in new_entry:
+        return new_entry or old_entry
+    return f"{new_entry}\n{old_entry}"
+
+
+def save_state(project_dir, head_sha, file_results):
+    """保存本次审计的提交和每个文件的结论
+
+    无发现的文件记为 None；请求失败的文件不记录，下次审计时会重新审计。
+    """
+    os.makedirs(INCREMENTAL_STATE_DIR, exist_ok=True)
+    state = {
+        'sha': head_sha,
+        'audited_at': time.strftime('%Y-%m-%d %H:%M:%S'),
+        'results': {
+            os.path.relpath(path, project_dir).replace('\\', '/'): entry
+            for path, entry in file_results.items()
+            if not (entry and entry.startswith('❌'))
+        }
+    }
+    with open(_state_path(project_dir), 'w', encoding='utf-8') as f:
+        json.dump(state, f, ensure_ascii=False)
+
+
+def head_commit(project_dir):
+    """项目当前的提交；项目目录不是 Git 仓库的根目录时返回 None
+
+    项目位于另一个仓库之中（如导入到本工具 projects/ 目录下的项目）时，git 命令作用于外层仓库，
+    diff 列不出项目内的变更，只能全量审计。
+    """
+    toplevel = _git(project_dir, 'rev-parse', '--show-toplevel')
+    if not toplevel or not _same_dir(toplevel.strip(), project_dir):
+        return None
+    output = _git(project_dir, 'rev-parse', 'HEAD')
+    return output.strip() if output else None
+
+
+def _same_dir(a, b):
+    return os.path.normcase(os.path.realpath(a)) == os.path.normcase(os.path.realpath(b))
+
+
+def _ensure_commit(project_dir, sha):
+    """确认旧提交在本地可用；浅克隆中缺失时尝试按 SHA 拉取"""
+    if _git(project_dir, 'cat-file', '-e', f'{sha}^{{commit}}') is not None:
+        return True
+    _git(project_dir, 'fetch', '--depth', '1', 'origin', sha)
+    return _git(project_dir, 'cat-file', '-e', f'{sha}^{{commit}}') is not None
+
+
+def changed_files(project_dir, base_sha):
+    """相对 base_sha 发生变化的文件（包含未提交的修改和未跟踪的新文件），返回相对路径集合"""
+    diff = _git(project_dir, 'diff', '--name-only', base_sha)
+    untracked = _git(project_dir, 'ls-files', '--others', '--exclude-standard')
+    if diff is None or untracked is None:
+        return None
+    return {line.strip() for line in (diff + untracked).splitlines() if line.strip()}
+
+
+def changed_ranges(project_dir, base_sha, context_lines):
+    """解析 git diff，返回 {相对路径: [(起始行, 结束行), ...]}（新文件中的行号，已加上下文）"""
+    output = _git(project_dir, 'diff', '-U0', '--no-color', base_sha)
+    if output is None:
+        return None
+    ranges = {}
+    current = None
+    for line in output.splitlines():
+        if line.startswith('+++ '):
+            target = line[4:].strip()
+            current = target[2:] if target.startswith('b/') else None
+            if current:
+                ranges.setdefault(current, [])
+            continue
+        match = _HUNK_RE.match(line)
+        if match and current:
+            start = int(match.group(1))
+            count = int(match.group(2)) if match.group(2) is not None else 1
+            end = start + max(count, 1) - 1
+            ranges[current].append((max(1, start - context_lines), end + context_lines))
+    return ranges
+
+
+def render_hunks(filename, content, ranges):
+    """只保留变更片段及其上下文，带真实行号"""
+    lines = content.splitlines()
+    merged = []
+    for start, end in sorted(ranges):
+        end = min(end, len(lines))
+        if start > end:
+            continue
+        if merged and start <= merged[-1][1] + 1:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+
+    output = [f"=== 变更片段：{filename}（行首数字为文件中的真实行号）==="]
+    for start, end in merged:
+        if len(output) > 1:
+            output.append("  ... |")
+        output.extend(f"{n:>5} | {lines[n - 1]}" for n in range(start, end + 1))
+    return "\n".join(output)
+
+
+class IncrementalPlanner:
+    """增量审计规划器
+
+    构造时对比上次审计的提交，之后对每个文件调用 select()：
+    未变化文件的结论从上次报告中沿用（记入 carried）并跳过审计，
+    变更过的文件返回需要审计的内容（hunks_only 时上次无发现的文件只保留变更片段及上下文）。
+    无法增量时 full 为 True，所有文件都原样审计。select() 可在多个读取线程中并发调用。
+    """
+
+    def __init__(self, project_dir, hunks_only=False, context_lines=20, max_snippet_chars=0, carried=None):
+        self.project_dir = project_dir
+        self.max_snippet_chars = max_snippet_chars
+        self.head_sha = head_commit(project_dir)
+        self.carried = carried if carried is not None else {}  # 多个项目可共用同一个字典
+        self.previous = {}
+        self.changed = set()
+        self.ranges = None
+        self.full = True
+        self.base_sha = None
+
+        state = load_state(project_dir)
+        if self.head_sha is None:
+            self.message = "非 Git 仓库（或项目目录不是仓库根目录），执行全量审计"
+        elif not state or not state.get('sha'):
+            self.message = "首次审计，执行全量审计"
+        elif not _ensure_commit(project_dir, state['sha']):
+            self.message = f"本地缺少上次审计的提交 {state['sha'][:8]}，执行全量审计"
+        else:
+            changed = changed_files(project_dir, state['sha'])
+            if changed is None:
+                self.message = "git diff 执行失败，执行全量审计"
+            else:
+                self.full = False
+                self.base_sha = state['sha']
+                self.changed = changed
+                self.previous = state.get('results', {})
+                self.ranges = changed_ranges(project_dir, self.base_sha, context_lines) if hunks_only else None
+                self.message = f"增量审计：{self.base_sha[:8]} → {self.head_sha[:8]}"
+
+    def select(self, path, content):
+        """返回需要审计的内容，文件未变化时返回 None"""
+        if self.full:
+            return content
+        relpath = os.path.relpath(path, self.project_dir).replace('\\', '/')
+        # 压缩包内的文件随所在的包一起判断是否变化
+        if outer_path(relpath) not in self.changed and relpath in self.previous:
+            if self.previous[relpath]:
+                self.carried[path] = self.previous[relpath]
+            return None
+
+        # 只审计变更片段的前提是上次没有发现：有旧结论的文件若只审片段，未变化部分的问题会从报告和状态中丢失，
+        # 沿用旧结论又会让已修复的问题一直留着，因此这类文件整体重新审计
+        if self.ranges and self.ranges.get(relpath) and relpath in self.previous and not self.previous[relpath]:
+            snippet = render_hunks(os.path.basename(path), content, self.ranges[relpath])
+            if not self.max_snippet_chars or len(snippet) <= self.max_snippet_chars:
+                return snippet
+        return content
+
+    def summary(self, total, audited):
+        if self.full:
+            return self.message
+        return f"{self.message}，{audited} 个文件有变更，{total - audited} 个文件沿用上次结论"
+
+
+def plan_incremental(project_dir, files_content, hunks_only=False, context_lines=20, max_snippet_chars=0):
+    """规划增量审计
+
+    对比上次审计的提交，只审计变更过的文件（hunks_only 时只审计变更片段及上下文），
+    未变化文件的结论从上次报告中沿用。无法增量时返回全部文件。
+    """
+    planner = IncrementalPlanner(project_dir, hunks_only, context_lines, max_snippet_chars)
+    to_audit = {}
+    for path, content in files_content.items():
+        selected = planner.select(path, content)
+        if selected is not None:
+            to_audit[path] = selected
+    return IncrementalPlan(planner.head_sha, to_audit, planner.carried,
+                           planner.summary(len(files_content), len(to_audit)))
+
+
+def project_of(path, project_dirs):
+    """文件所属的项目目录（取最长匹配），不属于任何项目时返回 None"""
+    matches = [project_dir for project_dir in project_dirs
+               if os.path.abspath(path).startswith(os.path.join(os.path.abspath(project_dir), ''))]
+    return max(matches, key=len) if matches else None
@@ -0,0 +1,137 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+from urllib.request import pathname2url
+
+from config import JS_CACHE_PATH, JS_CACHE_MAX_AGE_DAYS, JS_KNOWN_LIBRARIES_PATH
+
+
+def load_known_libraries(path=JS_KNOWN_LIBRARIES_PATH):
+    """读取已知第三方库的哈希列表，返回 {sha256: 库名}（文件不存在时为空）"""
+    libraries = {}
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if not line or line.startswith('#'):
+                    continue
+                digest, _, name = line.partition(' ')
+                libraries[digest.lower()] = name.strip() or digest[:12]
+    except OSError:
+        pass
+    return libraries
+
+
+class JSResultCache:
+    """JS 接口提取结果的本地缓存
+
+    以 (文件内容 sha256, 提取引擎) 为键保存提取出的 URL、API 和相对路径，
+    不同项目中相同的 vendor bundle、chunk 文件只解析一次。命中已知第三方库列表的文件直接跳过。
+    readonly 为 True 时只查询不写入（提取子进程中使用，结果统一由主进程写入）。
+    """
+
+    def __init__(self, db_path=JS_CACHE_PATH, max_age_days=JS_CACHE_MAX_AGE_DAYS,
+                 known_path=JS_KNOWN_LIBRARIES_PATH, readonly=False):
+        self.db_path = db_path
+        self.max_age = max_age_days * 86400
+        self.known = load_known_libraries(known_path)
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._conn = None
+
+        try:
+            if readonly:
+                uri = f"file:{pathname2url(os.path.abspath(db_path))}?mode=ro"
+                self._conn = sqlite3.connect(uri, uri=True, check_same_thread=False)
+                return
+            os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+            self._conn = sqlite3.connect(db_path, check_same_thread=False)
+            # WAL 模式下提取子进程可以在主进程写入的同时读取
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS results (
+                    sha256 TEXT NOT NULL,
+                    engine TEXT NOT NULL,
+                    urls TEXT NOT NULL,
+                    apis TEXT NOT NULL,
+                    paths TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    last_used REAL NOT NULL,
+                    PRIMARY KEY (sha256, engine)
+                )
+            """)
+            self._conn.commit()
+        except sqlite3.Error:
+            # 缓存不可用（数据库尚未创建、损坏或目录不可写）时按未命中处理
+            self._conn = None
+
+    def known_library(self, digest):
+        """内容哈希命中已知第三方库时返回库名，否则返回 None"""
+        return self.known.get(digest)
+
+    def get_many(self, digests, engine):
+        """批量查询，返回 {sha256: (urls, apis, paths)}，只包含命中的条目"""
+        digests = list(set(digests))
+        found = {}
+        if self._conn is not None and digests:
+            with self._lock:
+                try:
+                    # 分段查询，避免超过 SQLite 的参数个数上限
+                    for start in range(0, len(digests), 500):
+                        chunk = digests[start:start + 500]
+                        marks = ','.join('?' * len(chunk))
+                        rows = self._conn.execute(
+                            f"SELECT sha256, urls, apis, paths FROM results WHERE engine = ? AND sha256 IN ({marks})",
+                            [engine] + chunk
+                        )
+                        for digest, urls, apis, paths in rows:
+                            found[digest] = (json.loads(urls), json.loads(apis), json.loads(paths))
+                except sqlite3.Error:
+                    pass
+        self.hits += len(found)
+        self.misses += len(digests) - len(found)
+        return found
+
+    def put_many(self, results, engine):
+        """写入 {sha256: (urls, apis, paths)}"""
+        if self._conn is None or not results:
+            return
+        now = time.time()
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO results (sha256, engine, urls, apis, paths, created_at, last_used) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [(digest, engine, json.dumps(sorted(urls)), json.dumps(sorted(apis)), json.dumps(sorted(paths)),
+                  now, now) for digest, (urls, apis, paths) in results.items()]
+            )
+            self._conn.commit()
+
+    def touch(self, digests, engine):
+        """刷新命中条目的最近使用时间"""
+        if self._conn is None or not digests:
+            return
+        now = time.time()
+        with self._lock:
+            self._conn.executemany(
+                "UPDATE results SET last_used = ? WHERE sha256 = ? AND engine = ?",
+                [(now, digest, engine) for digest in set(digests)]
+            )
+            self._conn.commit()
+
+    def evict(self):
+        """删除超过 max_age 未被使用的条目，返回删除的条目数"""
+        if self._conn is None or not self.max_age:
+            return 0
+        with self._lock:
+            cursor = self._conn.execute("DELETE FROM results WHERE last_used < ?", (time.time() - self.max_age,))
+            self._conn.commit()
+            return cursor.rowcount
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
@@ -0,0 +1,238 @@
+import asyncio
+import hashlib
+import threading
+import time
+from html.parser import HTMLParser
+from urllib.parse import urljoin, urlsplit, urldefrag
+
+from config import (JS_CRAWL_MAX_DEPTH, JS_CRAWL_MAX_BYTES, JS_CRAWL_MAX_FILE_BYTES, JS_CRAWL_MAX_FILES,
+                    JS_CRAWL_PER_HOST, JS_CRAWL_SAME_HOST, JS_CACHE_ENABLED)
+from core.async_http import AsyncHTTPClient, HTTPCache, HTTPError
+from core.js_cache import load_known_libraries
+from core.js_scanner import iter_literals
+from core.jsfinder import JSFinder
+from core.route_trie import RouteTrie, route_pattern
+
+_SCRIPT_SUFFIXES = ('.js', '.mjs')
+_PRELOAD_RELS = {'modulepreload', 'preload', 'prefetch'}
+
+
+class _ScriptCollector(HTMLParser):
+    """收集页面中的外部脚本地址和内联脚本内容"""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.sources = []
+        self.inline = []
+        self._in_script = False
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        if tag == 'script':
+            if attrs.get('src'):
+                self.sources.append(attrs['src'])
+            else:
+                self._in_script = True
+                self.inline.append('')
+        elif tag == 'link' and attrs.get('href'):
+            rels = set((attrs.get('rel') or '').lower().split())
+            if rels & _PRELOAD_RELS and (attrs.get('as') == 'script' or 'modulepreload' in rels):
+                self.sources.append(attrs['href'])
+
+    def handle_endtag(self, tag):
+        if tag == 'script':
+            self._in_script = False
+
+    def handle_data(self, data):
+        if self._in_script:
+            self.inline[-1] += data
+
+
+def parse_html(text):
+    """返回 (外部脚本地址列表, 内联脚本列表)"""
+    collector = _ScriptCollector()
+    try:
+        collector.feed(text)
+        collector.close()
+    except (AssertionError, ValueError):
+        # 严重畸形的页面：保留已经解析出的部分
+        pass
+    return collector.sources, [script for script in collector.inline if script.strip()]
+
+
+def script_references(text):
+    """JS 中引用的其他脚本（import 语句、动态 import()、webpack chunk 表中的 *.js 字符串）"""
+    refs = []
+    for _, literal in iter_literals(text):
+        path = literal.split('?', 1)[0].split('#', 1)[0]
+        if path.endswith(_SCRIPT_SUFFIXES) and ' ' not in path and '${}' not in path and len(path) < 300:
+            refs.append(literal)
+    return refs
+
+
+def _is_html(response):
+    content_type = response.headers.get('content-type', '').lower()
+    if 'html' in content_type:
+        return True
+    if 'javascript' in content_type or 'ecmascript' in content_type:
+        return False
+    return response.body[:512].lstrip()[:1] == b'<'
+
+
+class JSCrawler:
+    """远程 JS 爬取
+
+    从 base_url 页面出发，下载其中引用的脚本，再从脚本中发现 import / chunk 引用继续下载，
+    最多 max_depth 层（页面为第 0 层）。下载通过 AsyncHTTPClient 并发进行（每个主机 per_host 个连接），
+    每个响应下载完成后立即在线程池中提取，与其余下载并行；相对 API 经 JSFinder 的 base_url 拼接为完整地址。
+    下载总量超过 max_bytes 或文件数超过 max_files 后不再发起新请求。结果格式与 JSExtractor 的目录结果一致。
+    """
+
+    def __init__(self, base_url, max_depth=JS_CRAWL_MAX_DEPTH, max_bytes=JS_CRAWL_MAX_BYTES,
+                 max_file_bytes=JS_CRAWL_MAX_FILE_BYTES, max_files=JS_CRAWL_MAX_FILES,
+                 per_host=JS_CRAWL_PER_HOST, same_host=JS_CRAWL_SAME_HOST, use_cache=JS_CACHE_ENABLED,
+                 on_progress=None, on_partial=None):
+        self.base_url = base_url
+        self.max_depth = max_depth
+        self.max_bytes = max_bytes
+        self.max_file_bytes = max_file_bytes
+        self.max_files = max_files
+        self.per_host = per_host
+        self.same_host = same_host
+        self.use_cache = use_cache
+        self.on_progress = on_progress
+        self.on_partial = on_partial
+        self.finder = JSFinder()
+        self.known = load_known_libraries() if use_cache else {}
+        self._host = urlsplit(base_url).hostname
+        self._stop = threading.Event()
+
+    def _emit(self, message):
+        if self.on_progress:
+            self.on_progress(message)
+
+    def stop(self):
+        """中断爬取（进行中的请求被取消）"""
+        self._stop.set()
+
+    def _in_scope(self, url):
+        parts = urlsplit(url)
+        return parts.scheme in ('http', 'https') and (not self.same_host or parts.hostname == self._host)
+
+    def _analyze(self, response, is_html):
+        """提取一个响应中的接口，返回 (提取结果, 引用的脚本地址, 已知库名)（在线程池中执行）"""
+        text = response.body.decode('utf-8', errors='replace')
+        if is_html:
+            sources, inline = parse_html(text)
+            refs = [urljoin(response.url, source) for source in sources]
+            scripts = inline
+        else:
+            library = self.known.get(hashlib.sha256(response.body).hexdigest())
+            if library:
+                return None, [], library
+            refs = []
+            for ref in script_references(text):
+                # ./chunk.js、../x.js 相对于脚本自身，其余（static/js/x.js、/x.js）相对于页面
+                refs.append(urljoin(response.url if ref.startswith('.') else self.base_url, ref))
+            scripts = [text]
+        found = {'urls': set(), 'apis': set(), 'paths': set()}
+        for script in scripts:
+            results = self.finder.extract_from_js(script, self.base_url)
+            for key in found:
+                found[key].update(results[key])
+        return found, refs, None
+
+    async def _fetch(self, client, url, max_bytes):
+        response = await client.get(url, max_bytes)
+        if response.status != 200:
+            raise HTTPError(f"HTTP {response.status}")
+        is_html = _is_html(response)
+        loop = asyncio.get_running_loop()
+        found, refs, library = await loop.run_in_executor(None, self._analyze, response, is_html)
+        return response, found, refs, library
+
+    def run(self):
+        """执行爬取，返回结果字典（在调用线程中运行独立的事件循环）"""
+        return asyncio.run(self._crawl())
+
+    async def _crawl(self):
+        self._emit(f"\n🌐 开始爬取: {self.base_url}")
+        result = {
+            'directory': self.base_url,
+            'urls': set(),
+            'routes': RouteTrie(),
+            'paths': set(),
+            'files_scanned': 0,
+            'errors': [],
+            'total': 1,
+            'cache_hits': 0,
+            'known_libraries': [],
+            'bytes': 0,
+            'elapsed': 0.0,
+        }
+        started = time.time()
+        cache = HTTPCache() if self.use_cache else None
+        client = AsyncHTTPClient(self.per_host, cache=cache)
+        seen = {urldefrag(self.base_url)[0]}
+        pending = {asyncio.ensure_future(self._fetch(client, self.base_url, self.max_file_bytes)): (self.base_url, 0)}
+        budget_hit = False
+        done_count = 0
+        try:
+            while pending:
+                if self._stop.is_set():
+                    break
+                done, _ = await asyncio.wait(pending, timeout=0.2, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    url, depth = pending.pop(task)
+                    done_count += 1
+                    try:
+                        response, found, refs, library = task.result()
+                    except (HTTPError, OSError, ValueError, EOFError, asyncio.LimitOverrunError) as e:
+                        result['errors'].append((url, str(e)))
+                        continue
+                    result['files_scanned'] += 1
+                    result['bytes'] += len(response.body)
+                    result['cache_hits'] += response.from_cache
+                    if library:
+                        result['known_libraries'].append((url, library))
+                        continue
+
+                    new_urls = found['urls'] - result['urls']
+                    result['urls'].update(new_urls)
+                    new_routes = []
+                    for api in found['apis']:
+                        if result['routes'].add(api, url):
+                            new_routes.append(route_pattern(api))
+                    result['paths'].update(found['paths'])
+
+                    if depth < self.max_depth:
+                        for ref in refs:
+                            ref = urldefrag(ref)[0]
+                            if ref in seen or not self._in_scope(ref):
+                                continue
+                            if result['bytes'] >= self.max_bytes or len(seen) >= self.max_files:
+                                budget_hit = True
+                                break
+                            seen.add(ref)
+                            # 单个响应不超过剩余的下载额度（并发请求之间不互相扣减，总量可能略超出）
+                            limit = min(self.max_file_bytes, self.max_bytes - result['bytes'])
+                            task = asyncio.ensure_future(self._fetch(client, ref, limit))
+                            pending[task] = (ref, depth + 1)
+                    result['total'] = len(seen)
+                    if self.on_partial:
+                        self.on_partial(self.base_url, sorted(new_urls), sorted(new_routes), done_count, len(seen))
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+            await client.close()
+            if cache:
+                cache.close()
+        if budget_hit:
+            self._emit(f"⚠️ 已达到爬取上限（{self.max_files} 个文件 / {self.max_bytes // 1024 // 1024} MB），"
+                       f"其余脚本未下载")
+        self._emit(f"📥 下载 {result['files_scanned']} 个文件（{result['bytes'] / 1024 / 1024:.1f} MB），"
+                   f"条件请求命中 {result['cache_hits']} 个，新建连接 {client.connections_opened} 个")
+        result['elapsed'] = time.time() - started
+        return result
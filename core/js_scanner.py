@@ -0,0 +1,206 @@
+import re
+
+# 只由单个字符类构成的正则（没有嵌套量词），匹配不会回溯，耗时与扫描长度成正比
+_TOKEN = re.compile(r'[\'"`/{}]')
+_STRING_STOP = {'"': re.compile(r'["\\\n]'), "'": re.compile(r"['\\\n]")}
+_TEMPLATE_STOP = re.compile(r'[`\\$]')
+_REGEX_STOP = re.compile(r'[/\\\[\]\n]')
+_WORD_TAIL = re.compile(r'[\w$]+$')
+
+_HOST_RUN = re.compile(r'[\w\-.]+')
+_URL_PATH_RUN = re.compile(r'[\w\-.,@?^=%&:/~+#]*')
+_API_VALUE = re.compile(r"[a-zA-Z0-9\-._~!$&'()*+,;=:@%/]+")
+_PATH_VALUE = re.compile(r'[\w\-.~%/]+')
+
+# 出现在这些字符或关键字之后的 / 是正则字面量的开始，否则是除号
+_REGEX_PRECEDERS = set('(,=:[!&|?{};+-*%<>~^')
+_REGEX_KEYWORDS = {'return', 'typeof', 'case', 'do', 'else', 'in', 'of', 'new', 'delete', 'void', 'throw',
+                   'instanceof', 'yield', 'await'}
+_MIME_TYPES = {'text', 'application', 'image', 'audio', 'video', 'multipart', 'font', 'model', 'message'}
+_TEMPLATE_HOLE = '${}'
+
+
+def _regex_allowed(text, index):
+    """根据 / 之前的第一个非空白字符判断它是否开始一个正则字面量"""
+    end = index
+    while end > 0 and text[end - 1] in ' \t\r\n':
+        end -= 1
+    if end == 0:
+        return True
+    previous = text[end - 1]
+    if previous in _REGEX_PRECEDERS:
+        return True
+    if previous.isalnum() or previous in '_$':
+        word = _WORD_TAIL.search(text, max(0, end - 12), end)
+        return bool(word) and word.group() in _REGEX_KEYWORDS
+    return False
+
+
+def _string_end(text, start, quote):
+    """返回字符串的结束位置（闭合引号；遇到换行视为未闭合，从换行处重新同步）"""
+    stop = _STRING_STOP[quote]
+    position = start
+    while True:
+        match = stop.search(text, position)
+        if not match:
+            return len(text)
+        if match.group() == '\\':
+            position = match.end() + 1
+            continue
+        return match.start()
+
+
+def _regex_end(text, start):
+    """跳过正则字面量，返回结束位置之后的下标（字符类 [...] 中的 / 不结束正则）"""
+    position = start
+    in_class = False
+    while True:
+        match = _REGEX_STOP.search(text, position)
+        if not match:
+            return len(text)
+        char = match.group()
+        position = match.end()
+        if char == '\\':
+            position += 1
+        elif char == '\n':
+            return position
+        elif char == '[':
+            in_class = True
+        elif char == ']':
+            in_class = False
+        elif not in_class:
+            return position
+
+
+def _unescape(value):
+    # 压缩后的代码和 JSON 中常见 \/ 转义，其他转义原样保留
+    return value.replace('\\/', '/') if '\\' in value else value
+
+
+def iter_literals(text):
+    """单遍扫描 JS 源码，按出现顺序产出 (引号, 字面量内容)
+
+    引号为 ' " 或 `；模板字符串中的 ${...} 替换为 ${}，表达式内部的字符串单独产出。
+    注释和正则字面量被跳过，不会把其中的引号误认为字符串开始。每个字符最多被检查常数次，
+    任何输入下耗时都与文本长度成正比。
+    """
+    length = len(text)
+    position = 0
+    # 模板字符串的 ${ 表达式栈：[(已收集的模板片段, 表达式内未闭合的 { 数量)]
+    templates = []
+
+    def scan_template(start, parts):
+        """从 start 开始读取模板字符串内容，返回 (下一个扫描位置, 是否进入了 ${ 表达式)"""
+        position = start
+        while True:
+            match = _TEMPLATE_STOP.search(text, position)
+            if not match:
+                parts.append(text[start:])
+                return length, False
+            char = match.group()
+            if char == '\\':
+                position = match.end() + 1
+            elif char == '$':
+                if text.startswith('{', match.end()):
+                    parts.append(text[start:match.start()])
+                    parts.append(_TEMPLATE_HOLE)
+                    templates.append([parts, 0])
+                    return match.end() + 1, True
+                position = match.end()
+            else:
+                parts.append(text[start:match.start()])
+                return match.end(), False
+
+    while position < length:
+        match = _TOKEN.search(text, position)
+        if not match:
+            return
+        index = match.start()
+        char = match.group()
+
+        if char == '"' or char == "'":
+            end = _string_end(text, index + 1, char)
+            yield char, _unescape(text[index + 1:end])
+            position = end + 1
+        elif char == '`':
+            parts = []
+            position, nested = scan_template(index + 1, parts)
+            if not nested:
+                yield '`', _unescape(''.join(parts))
+        elif char == '/':
+            following = text[index + 1:index + 2]
+            if following == '/':
+                end = text.find('\n', index)
+                position = length if end < 0 else end + 1
+            elif following == '*':
+                end = text.find('*/', index + 2)
+                position = length if end < 0 else end + 2
+            elif _regex_allowed(text, index):
+                position = _regex_end(text, index + 1)
+            else:
+                position = index + 1
+        elif char == '{':
+            if templates:
+                templates[-1][1] += 1
+            position = index + 1
+        else:
+            position = index + 1
+            if templates:
+                if templates[-1][1]:
+                    templates[-1][1] -= 1
+                    continue
+                # ${ 表达式结束，回到外层模板字符串继续读取
+                parts = templates.pop()[0]
+                position, nested = scan_template(position, parts)
+                if not nested:
+                    yield '`', _unescape(''.join(parts))
+
+
+def find_urls(value):
+    """在字面量中查找 (https?:)//域名/路径 形式的 URL，与原正则的匹配范围一致
+
+    域名至少包含一个点，路径的最后一个字符不能是 . , : 这类标点。
+    """
+    start = 0
+    while True:
+        index = value.find('//', start)
+        if index < 0:
+            return
+        start = index + 2
+        host = _HOST_RUN.match(value, start)
+        if not host:
+            continue
+        name = host.group()
+        if '..' in name:
+            name = name[:name.index('..')]
+        name = name.rstrip('.')
+        if not name or name[0] == '.' or '.' not in name:
+            continue
+        end = start + len(name)
+        if end == host.end() and value.startswith('/', end):
+            path = _URL_PATH_RUN.match(value, end).group().rstrip('.,:')
+            # 原正则要求 / 之后至少还有一个字符
+            end += len(path) if len(path) > 1 else 0
+        scheme = 'https:' if value.endswith('https:', 0, index) else 'http:' if value.endswith('http:', 0, index) else ''
+        yield scheme + value[index:end]
+        start = end
+
+
+def is_api_path(value):
+    """以 / 开头、由非空路径段组成的接口路径（如 /api/user/list）"""
+    return (
+        len(value) > 1 and value[0] == '/' and value[1] != '/' and value[-1] != '/'
+        and '//' not in value and _API_VALUE.fullmatch(value) is not None
+    )
+
+
+def is_relative_path(value):
+    """不以 / 开头的相对接口路径（如 api/user/list），排除 MIME 类型、纯数字日期等"""
+    if '/' not in value or value[0] in '/.' or len(value) > 200 or not _PATH_VALUE.fullmatch(value):
+        return False
+    segments = value.rstrip('/').split('/')
+    if len(segments) < 2 or '' in segments:
+        return False
+    if len(segments) == 2 and segments[0].lower() in _MIME_TYPES:
+        return False
+    return any(char.isalpha() for char in segments[0])
@@ -0,0 +1,358 @@
+import multiprocessing
+import os
+import re
+import threading
+import time
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from urllib.parse import urljoin
+
+from config import (JS_EXTRACT_PROCESSES, JS_EXTRACT_BATCH_BYTES, JS_EXTRACT_INLINE_BYTES, JS_EXTRACT_ENGINE,
+                    JS_CACHE_ENABLED, JS_CACHE_PATH, JS_EXTRACT_EXCLUDE_DIRS, JS_EXTRACT_MAX_FILE_BYTES)
+from core.content_store import ContentStore, UNREADABLE
+from core.file_index import FileIndex
+from core.js_cache import JSResultCache
+from core.js_scanner import iter_literals, find_urls, is_api_path, is_relative_path
+from core.route_trie import RouteTrie
+from core.walker import WalkStats
+
+JS_EXTENSIONS = ('.js', '.jsx', '.vue', '.ts', '.tsx', '.html', '.htm')
+
+# 一批文件的提取结果（可跨进程传递）
+# routes 为按路由模板合并后的 API（RouteTrie，带来源文件），cached 为命中缓存的内容哈希，
+# known 为跳过的已知第三方库 [(路径, 库名)]，fresh 为新解析的 {内容哈希: (urls, apis, paths)}
+BatchResult = namedtuple('BatchResult', ['paths', 'scanned', 'urls', 'routes', 'relative_paths', 'errors', 'hashes',
+                                         'cached', 'known', 'fresh'])
+
+
+class JSFinder:
+    """JS接口提取器
+
+    engine 为 'tokenizer'（默认）时单遍扫描字符串和模板字面量（core.js_scanner），耗时与文件大小成正比，
+    并额外给出 api/user/list 这类相对路径；为 'regex' 时使用原来的两个正则，保留用于对比。
+    """
+    CACHE_VERSION = 1  # 提取规则变化时递增，使缓存中的旧结果失效
+
+    def __init__(self, engine=JS_EXTRACT_ENGINE):
+        self.engine = engine
+        self.cache_tag = f"{engine}/{self.CACHE_VERSION}"
+        # URL正则模式 - 优化匹配规则
+        self.url_pattern = re.compile(
+            r'''(?:https?:)?//(?:[\w\-_]+[.])+[\w\-_]+(?:/[\w\-.,@?^=%&:/~+#]*[\w\-@?^=%&/~+#])?''',
+            re.VERBOSE
+        )
+        # API端点正则模式 - 优化匹配规则
+        self.api_pattern = re.compile(
+            r'''(?:["'])((?:/[a-zA-Z0-9\-._~!$&'()*+,;=:@%]+)+)(?:["'])''',
+            re.VERBOSE
+        )
+
+    def clean_url(self, url):
+        """清理URL"""
+        # 去除无效的URL
+        if url.endswith(('"}', '"', "'", '"}}')):
+            url = url.rstrip('"}\'}}')
+        # 去除JavaScript代码片段
+        if '.js' in url and ('"+' in url or '",' in url):
+            return None
+        # 去除明显的代码模板
+        if '${' in url or '{' in url or '}' in url:
+            return None
+        return url
+
+    def clean_api(self, api):
+        """清理API端点"""
+        # 去除无效的API端点
+        if api.endswith(('"}', '"', "'", '"}}')):
+            api = api.rstrip('"}\'}}')
+        # 去除文件扩展名结尾的路径
+        if api.endswith(('.js', '.css', '.html', '.png', '.jpg', '.gif')):
+            return None
+        # 去除明显的代码模板
+        if '${' in api or '{' in api or '}' in api:
+            return None
+        # 去除过短的路径
+        if len(api.split('/')) < 2:
+            return None
+        return api
+
+    def _add_url(self, results, url):
+        cleaned_url = self.clean_url(url)
+        if cleaned_url:
+            if not cleaned_url.startswith('http'):
+                cleaned_url = 'http:' + cleaned_url
+            results['urls'].add(cleaned_url)
+
+    def _add_api(self, results, api, base_url):
+        cleaned_api = self.clean_api(api)
+        if cleaned_api:
+            if base_url and not cleaned_api.startswith('http'):
+                cleaned_api = urljoin(base_url, cleaned_api)
+            results['apis'].add(cleaned_api)
+
+    def extract_from_js(self, content, base_url=None):
+        """从JS内容中提取URL、API端点和相对路径"""
+        results = {
+            'urls': set(),
+            'apis': set(),
+            'paths': set()
+        }
+        if self.engine == 'regex':
+            return self._extract_with_regex(content, base_url, results)
+
+        for _, literal in iter_literals(content):
+            # 先用开头字符和子串做廉价判断，绝大多数字面量不会进入后续检查
+            if '//' in literal:
+                for url in find_urls(literal):
+                    self._add_url(results, url)
+            elif literal.startswith('/'):
+                if is_api_path(literal):
+                    self._add_api(results, literal, base_url)
+            elif '/' in literal and is_relative_path(literal) and self.clean_api('/' + literal):
+                results['paths'].add(literal)
+        return results
+
+    def _extract_with_regex(self, content, base_url, results):
+        # 提取完整URL
+        urls = self.url_pattern.findall(content)
+        for url in urls:
+            self._add_url(results, url)
+
+        # 提取API端点
+        apis = self.api_pattern.findall(content)
+        for api in apis:
+            self._add_api(results, api, base_url)
+
+        return results
+
+
+def join_apis(apis, base_url):
+    """把以 / 开头的 API 路径拼接到 base_url 上（缓存中保存的是未拼接的路径）"""
+    if not base_url:
+        return set(apis)
+    return {api if api.startswith('http') else urljoin(base_url, api) for api in apis}
+
+
+def extract_batch(entries, base_url=None, cache_path=None):
+    """提取一批文件中的 URL 和 API（在子进程或后台线程中执行）
+
+    entries 为 [(路径, 大小, 修改时间)]，文件由执行方自己读取，进程间只传路径和结果。
+    cache_path 不为空时读取文件后先按内容哈希查询缓存（只读），命中缓存或已知第三方库的文件不再解析，
+    新解析的结果放在 BatchResult.fresh 中，由主进程统一写入缓存。
+    """
+    store = ContentStore(max_member_bytes=JS_EXTRACT_MAX_FILE_BYTES)
+    finder = JSFinder()
+    cache = JSResultCache(cache_path, readonly=True) if cache_path else None
+    urls, relative_paths = set(), set()
+    routes = RouteTrie()
+    scanned = 0
+    cached, known, fresh = [], [], {}
+    for path, size, mtime in entries:
+        store.add(path, size, mtime)
+        content = store.read(path)
+        if content is UNREADABLE:
+            continue
+        scanned += 1
+        digest = store.sha256(path)
+        found = None
+        if cache is not None:
+            library = cache.known_library(digest)
+            if library:
+                known.append((path, library))
+                continue
+            found = fresh.get(digest) or cache.get_many([digest], finder.cache_tag).get(digest)
+            if found:
+                cached.append(digest)
+        if found is None:
+            results = finder.extract_from_js(content)
+            found = fresh[digest] = (results['urls'], results['apis'], results['paths'])
+        urls.update(found[0])
+        for api in join_apis(found[1], base_url):
+            routes.add(api, path)
+        relative_paths.update(found[2])
+    store.close()
+    if cache is not None:
+        cache.close()
+    return BatchResult([entry[0] for entry in entries], scanned, urls, routes, relative_paths, store.errors,
+                       store.hashes(), cached, known, fresh)
+
+
+def shard(entries, max_bytes=JS_EXTRACT_BATCH_BYTES):
+    """按文件大小把待分析文件切成批次：小文件合并成一批，超过 max_bytes 的大 bundle 单独成批"""
+    batch, batch_bytes = [], 0
+    for entry in entries:
+        if batch and batch_bytes + entry[1] > max_bytes:
+            yield batch
+            batch, batch_bytes = [], 0
+        batch.append(tuple(entry))
+        batch_bytes += entry[1]
+    if batch:
+        yield batch
+
+
+class JSExtractor:
+    """多进程 JS 接口提取引擎
+
+    按目录依次处理：通过文件索引遍历待分析文件，按大小分批后交给进程池并行提取，
+    每完成一批就通过 on_partial(目录, 新增URL, 新增路由, 已完成文件数, 文件总数) 返回增量结果，
+    目录处理完后通过 on_directory(结果) 返回汇总。文件总大小不足 JS_EXTRACT_INLINE_BYTES
+    或只有一个进程时直接在当前线程中提取，不启动进程池。
+    启用缓存时，文件索引中已有内容哈希的文件先在主进程中查询缓存，命中的文件不再读取和分发，
+    其余文件由执行方读取后按哈希查询；命中已知第三方库列表的文件直接跳过。
+    """
+
+    def __init__(self, directories, processes=JS_EXTRACT_PROCESSES, base_url=None,
+                 on_progress=None, on_partial=None, on_directory=None, use_cache=JS_CACHE_ENABLED):
+        self.directories = [directories] if isinstance(directories, str) else list(directories)
+        self.processes = processes or os.cpu_count() or 1
+        self.base_url = base_url
+        self.use_cache = use_cache
+        self.cache_tag = JSFinder().cache_tag
+        self.on_progress = on_progress
+        self.on_partial = on_partial
+        self.on_directory = on_directory
+        self.results = []
+        self._pool = None
+        self._stop = threading.Event()
+
+    def _emit(self, message):
+        if self.on_progress:
+            self.on_progress(message)
+
+    def stop(self):
+        """中断提取（已提交的批次不再等待）"""
+        self._stop.set()
+
+    def _executor(self):
+        if self._pool is None:
+            # spawn 方式启动子进程：不继承界面进程中的线程和锁，各平台行为一致
+            self._pool = ProcessPoolExecutor(self.processes, mp_context=multiprocessing.get_context('spawn'))
+        return self._pool
+
+    def _run_batches(self, batches, inline):
+        """逐个产出 BatchResult；进程池模式下同时在途的批次不超过进程数的 2 倍"""
+        if inline:
+            for batch in batches:
+                if self._stop.is_set():
+                    return
+                yield extract_batch(batch, self.base_url, self._cache_path)
+            return
+
+        pool = self._executor()
+        pending = set()
+        batches = iter(batches)
+        while True:
+            while len(pending) < self.processes * 2 and not self._stop.is_set():
+                batch = next(batches, None)
+                if batch is None:
+                    break
+                pending.add(pool.submit(extract_batch, batch, self.base_url, self._cache_path))
+            if not pending or self._stop.is_set():
+                for future in pending:
+                    future.cancel()
+                return
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
+
+    @property
+    def _cache_path(self):
+        return JS_CACHE_PATH if self.use_cache else None
+
+    def _lookup_cached(self, cache, index, entries, result):
+        """用文件索引中记录的内容哈希查询缓存，合并命中的结果，返回仍需读取提取的文件"""
+        digests = {entry.path: index.sha256.get(entry.path) for entry in entries}
+        hits = cache.get_many([digest for digest in digests.values() if digest], self.cache_tag)
+        remaining = []
+        for entry in entries:
+            digest = digests[entry.path]
+            library = cache.known_library(digest) if digest else None
+            if library:
+                result['known_libraries'].append((entry.path, library))
+            elif digest in hits:
+                urls, apis, paths = hits[digest]
+                result['urls'].update(urls)
+                for api in join_apis(apis, self.base_url):
+                    result['routes'].add(api, entry.path)
+                result['paths'].update(paths)
+                result['cache_hits'] += 1
+            else:
+                remaining.append(entry)
+        cache.touch(hits, self.cache_tag)
+        return remaining
+
+    def _scan_directory(self, directory):
+        self._emit(f"\n📂 分析目录: {directory}")
+        index = FileIndex(directory)
+        walk_stats = WalkStats()
+        # 不沿用审计的遍历默认值：构建目录、.gitignore 忽略的产物和大体积 bundle 都要提取
+        entries = list(index.refresh(JS_EXTENSIONS, walk_stats, exclude_dirs=JS_EXTRACT_EXCLUDE_DIRS,
+                                     gitignore=False, max_size=JS_EXTRACT_MAX_FILE_BYTES))
+        total_bytes = sum(entry.size for entry in entries)
+        self._emit(f"找到 {len(entries)} 个待分析文件（{total_bytes / 1024 / 1024:.1f} MB）")
+        self._emit(index.summary())
+
+        result = {
+            'directory': directory,
+            'urls': set(),
+            'routes': RouteTrie(),  # API 按 /user/{id} 这类路由模板合并，保留次数和来源文件
+            'paths': set(),
+            'files_scanned': 0,
+            'errors': list(walk_stats.archive_errors),
+            'total': len(entries),
+            'cache_hits': 0,
+            'known_libraries': [],
+            'elapsed': 0.0,
+        }
+        started = time.time()
+        cache = JSResultCache() if self.use_cache else None
+        pending = entries
+        if cache is not None:
+            pending = self._lookup_cached(cache, index, entries, result)
+            total_bytes = sum(entry.size for entry in pending)
+        # 命中缓存和已知第三方库的文件同样计入已扫描
+        done = result['files_scanned'] = len(entries) - len(pending)
+        if done and self.on_partial:
+            routes = [route.pattern for route in result['routes'].routes()]
+            self.on_partial(directory, sorted(result['urls']), routes, done, len(entries))
+        inline = self.processes <= 1 or total_bytes < JS_EXTRACT_INLINE_BYTES
+        hashes = {}
+        for batch in self._run_batches(shard(pending), inline):
+            done += len(batch.paths)
+            result['files_scanned'] += batch.scanned
+            result['cache_hits'] += len(batch.cached)
+            result['known_libraries'].extend(batch.known)
+            result['errors'].extend(batch.errors)
+            hashes.update(batch.hashes)
+            if cache is not None:
+                cache.put_many(batch.fresh, self.cache_tag)
+                cache.touch(batch.cached, self.cache_tag)
+            new_urls = batch.urls - result['urls']
+            new_routes = result['routes'].merge(batch.routes)
+            result['urls'].update(new_urls)
+            result['paths'].update(batch.relative_paths)
+            if self.on_partial:
+                self.on_partial(directory, sorted(new_urls), new_routes, done, len(entries))
+        result['elapsed'] = time.time() - started
+        index.record_hashes(hashes)
+        index.close()
+        if cache is not None:
+            cache.evict()
+            cache.close()
+        return result
+
+    def run(self):
+        """依次处理所有目录，返回各目录的汇总结果列表"""
+        try:
+            for directory in self.directories:
+                if self._stop.is_set():
+                    break
+                result = self._scan_directory(directory)
+                self.results.append(result)
+                if self.on_directory:
+                    self.on_directory(result)
+        finally:
+            if self._pool is not None:
+                self._pool.shutdown(wait=not self._stop.is_set(), cancel_futures=True)
+                self._pool = None
+        return self.results
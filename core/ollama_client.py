@@ -0,0 +1,364 @@
+import random
+import re
+import threading
+import time
+from collections import deque
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from config import (
+    OLLAMA_API_URL, OLLAMA_MODEL, OLLAMA_ENDPOINTS, OLLAMA_POOL_SIZE, OLLAMA_CONNECT_TIMEOUT,
+    OLLAMA_MAX_RETRIES, OLLAMA_RETRY_BACKOFF, OLLAMA_BREAKER_THRESHOLD, OLLAMA_BREAKER_COOLDOWN,
+    OLLAMA_KEEP_ALIVE, OLLAMA_WARMUP_TIMEOUT
+)
+from core.streaming import stream_generate
+
+_RETRY_STATUS = {500, 502, 503, 504}
+
+
+class OllamaUnavailable(requests.ConnectionError):
+    """熔断器打开期间直接失败，不再请求 Ollama"""
+
+
+class OllamaResponseError(ValueError):
+    """Ollama 返回的数据缺少 response 字段"""
+
+
+def normalize_base_url(url):
+    """统一 Ollama 基础地址：去掉结尾的 / 和 /api/... 路径"""
+    return url.split('/api')[0].rstrip('/')
+
+
+class LatencyStats:
+    """请求耗时统计（保留最近 1000 次）"""
+
+    def __init__(self, window=1000):
+        self._samples = deque(maxlen=window)
+        self._lock = threading.Lock()
+        self.count = 0
+        self.failures = 0
+
+    def record(self, seconds, ok=True):
+        with self._lock:
+            self._samples.append(seconds)
+            self.count += 1
+            if not ok:
+                self.failures += 1
+
+    def merge(self, other):
+        with other._lock:
+            samples = list(other._samples)
+            count, failures = other.count, other.failures
+        with self._lock:
+            self._samples.extend(samples)
+            self.count += count
+            self.failures += failures
+
+    def percentile(self, p):
+        with self._lock:
+            samples = sorted(self._samples)
+        if not samples:
+            return 0.0
+        return samples[min(len(samples) - 1, int(len(samples) * p / 100))]
+
+    def summary(self):
+        if not self.count:
+            return None
+        return (f"📶 Ollama 请求 {self.count} 次（失败 {self.failures} 次），"
+                f"耗时 P50 {self.percentile(50):.1f}s / P95 {self.percentile(95):.1f}s")
+
+
+class OllamaClient:
+    """共享的 Ollama 客户端
+
+    使用连接池复用 HTTP keep-alive 连接；5xx 和连接中断时带随机抖动地指数退避重试；
+    连续失败达到阈值后熔断一段时间，期间请求直接失败，避免每个文件都等待超时。
+    """
+
+    def __init__(self, base_url=OLLAMA_API_URL, pool_size=OLLAMA_POOL_SIZE, max_retries=OLLAMA_MAX_RETRIES,
+                 backoff=OLLAMA_RETRY_BACKOFF, breaker_threshold=OLLAMA_BREAKER_THRESHOLD,
+                 breaker_cooldown=OLLAMA_BREAKER_COOLDOWN):
+        self.base_url = normalize_base_url(base_url)
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.breaker_threshold = breaker_threshold
+        self.breaker_cooldown = breaker_cooldown
+        self.latency = LatencyStats()
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+        self._lock = threading.Lock()
+        self._consecutive_failures = 0
+        self._open_until = 0.0
+
+    @property
+    def generate_url(self):
+        return f"{self.base_url}/api/generate"
+
+    def available(self):
+        """熔断器未打开，或冷却已结束可以放行试探请求"""
+        with self._lock:
+            return not self._open_until or time.time() >= self._open_until
+
+    def _check_breaker(self):
+        with self._lock:
+            if not self._open_until:
+                return
+            now = time.time()
+            if now < self._open_until:
+                raise OllamaUnavailable(
+                    f"Ollama 连续失败 {self._consecutive_failures} 次，熔断中（{self._open_until - now:.0f}s 后重试）"
+                )
+            # 冷却结束：放行这一次试探请求，其余请求在试探结果出来前继续快速失败
+            self._open_until = now + self.breaker_cooldown
+
+    def _record_result(self, ok):
+        with self._lock:
+            if ok:
+                self._consecutive_failures = 0
+                self._open_until = 0.0
+            else:
+                self._consecutive_failures += 1
+                if self._consecutive_failures >= self.breaker_threshold:
+                    self._open_until = time.time() + self.breaker_cooldown
+
+    def _record_failure(self, error):
+        """只有连接失败和 5xx 说明节点故障，计入熔断
+
+        读超时多是生成时间过长，4xx 和流中途的错误多由请求本身引起（如提示词过长），节点仍能正常响应：
+        收到了响应的按成功处理，读超时不影响熔断状态。
+        """
+        if _is_failover_error(error):
+            self._record_result(False)
+        elif not isinstance(error, requests.Timeout):
+            self._record_result(True)
+
+    def _sleep_before_retry(self, attempt):
+        time.sleep(self.backoff * (2 ** attempt) * random.uniform(0.5, 1.5))
+
+    def _call(self, func, stats):
+        """执行一次请求，按需重试并维护熔断状态与耗时统计"""
+        self._check_breaker()
+        attempt = 0
+        while True:
+            start = time.time()
+            try:
+                result = func()
+            except requests.HTTPError as e:
+                status = e.response.status_code if e.response is not None else None
+                retryable = status in _RETRY_STATUS
+                error = e
+            except (requests.ConnectionError, requests.exceptions.ChunkedEncodingError) as e:
+                retryable = True
+                error = e
+            except requests.Timeout as e:
+                # 读超时说明模型仍在生成，重试只会加倍等待
+                retryable = isinstance(e, requests.ConnectTimeout)
+                error = e
+            except requests.RequestException as e:
+                retryable = False
+                error = e
+            else:
+                elapsed = time.time() - start
+                for collector in (self.latency, stats):
+                    if collector is not None:
+                        collector.record(elapsed)
+                self._record_result(True)
+                return result
+
+            elapsed = time.time() - start
+            for collector in (self.latency, stats):
+                if collector is not None:
+                    collector.record(elapsed, ok=False)
+            if not retryable or attempt >= self.max_retries:
+                self._record_failure(error)
+                raise error
+            attempt += 1
+            self._sleep_before_retry(attempt)
+
+    def generate(self, prompt, model=OLLAMA_MODEL, timeout=300, stream=False, max_chars=0,
+                 early_stop=True, strip_think=True, stats=None):
+        """调用 /api/generate，返回 (回答文本, 提前终止原因)
+
+        stream=True 时走流式解析并可提前终止（见 core.streaming.stream_generate），
+        流式模式下思考过程总是被去除；非流式模式由 strip_think 决定。
+        """
+        payload = {"model": model, "prompt": prompt, "stream": False, "keep_alive": OLLAMA_KEEP_ALIVE}
+        request_timeout = (OLLAMA_CONNECT_TIMEOUT, timeout)
+
+        if stream:
+            return self._call(
+                lambda: stream_generate(self.generate_url, payload, request_timeout, max_chars,
+                                        early_stop, session=self.session),
+                stats
+            )
+
+        def request():
+            response = self.session.post(self.generate_url, json=payload, timeout=request_timeout)
+            response.raise_for_status()
+            return response.json()
+
+        result = self._call(request, stats)
+        if "response" not in result:
+            raise OllamaResponseError(f"响应缺少 response 字段: {str(result)[:200]}")
+        text = result["response"]
+        if strip_think:
+            text = re.sub(r'<think>.*?</think>', '', text, flags=re.DOTALL)
+        return text, None
+
+    def warm_up(self, model=OLLAMA_MODEL, keep_alive=OLLAMA_KEEP_ALIVE, timeout=OLLAMA_WARMUP_TIMEOUT):
+        """预加载模型：不带 prompt 的 generate 请求只加载模型不生成，返回耗时（秒）
+
+        预热不计入请求耗时统计，但失败会计入熔断器。
+        """
+        start = time.time()
+        try:
+            response = self.session.post(
+                self.generate_url, json={"model": model, "keep_alive": keep_alive},
+                timeout=(OLLAMA_CONNECT_TIMEOUT, timeout)
+            )
+            response.raise_for_status()
+        except requests.RequestException as e:
+            self._record_failure(e)
+            raise
+        self._record_result(True)
+        return time.time() - start
+
+
+class _Endpoint:
+    def __init__(self, client, weight, max_concurrency):
+        self.client = client
+        self.weight = max(float(weight), 0.01)
+        self.max_concurrency = max(0, int(max_concurrency))
+        self.in_flight = 0
+
+    def has_slot(self):
+        return not self.max_concurrency or self.in_flight < self.max_concurrency
+
+
+def _is_failover_error(error):
+    """节点故障（连接失败、熔断中、5xx），可以换一个节点重试"""
+    if isinstance(error, requests.HTTPError):
+        return error.response is not None and error.response.status_code in _RETRY_STATUS
+    return isinstance(error, (requests.ConnectionError, requests.exceptions.ChunkedEncodingError))
+
+
+class OllamaDispatcher:
+    """多节点 Ollama 调度器
+
+    每个请求发往当前负载（进行中请求数 / 权重）最低的健康节点，节点达到 max_concurrency 时排队等待。
+    每个节点有独立的熔断器：连续失败后被摘除，冷却结束后由下一个请求试探，成功即恢复。
+    节点故障时请求自动转发到其他节点。
+    """
+
+    def __init__(self, endpoints):
+        if not endpoints:
+            raise ValueError("至少需要一个 Ollama 节点")
+        self.endpoints = endpoints
+        self._cond = threading.Condition()
+
+    @classmethod
+    def from_settings(cls, endpoints=OLLAMA_ENDPOINTS, default_url=OLLAMA_API_URL):
+        if not endpoints:
+            return cls([_Endpoint(OllamaClient(default_url), 1, 0)])
+        # 多节点时由调度器换节点重试，单个节点内不再重试，避免故障节点拖慢请求
+        return cls([
+            _Endpoint(OllamaClient(item['url'], max_retries=0), item.get('weight', 1), item.get('max_concurrency', 0))
+            for item in endpoints
+        ])
+
+    @property
+    def capacity(self):
+        """所有节点的并发上限之和（任一节点未限制时返回 0）"""
+        if any(not endpoint.max_concurrency for endpoint in self.endpoints):
+            return 0
+        return sum(endpoint.max_concurrency for endpoint in self.endpoints)
+
+    @property
+    def latency(self):
+        if len(self.endpoints) == 1:
+            return self.endpoints[0].client.latency
+        merged = LatencyStats()
+        for endpoint in self.endpoints:
+            merged.merge(endpoint.client.latency)
+        return merged
+
+    def _acquire(self, exclude):
+        with self._cond:
+            while True:
+                healthy = [endpoint for endpoint in self.endpoints
+                           if endpoint not in exclude and endpoint.client.available()]
+                if not healthy:
+                    raise OllamaUnavailable("所有 Ollama 节点均不可用（熔断中或已失败）")
+                free = [endpoint for endpoint in healthy if endpoint.has_slot()]
+                if free:
+                    endpoint = min(free, key=lambda e: ((e.in_flight + 1) / e.weight, -e.weight))
+                    endpoint.in_flight += 1
+                    return endpoint
+                # 节点都满载：等待有请求完成（定时醒来重新检查节点健康状态）
+                self._cond.wait(timeout=1.0)
+
+    def _release(self, endpoint):
+        with self._cond:
+            endpoint.in_flight -= 1
+            self._cond.notify()
+
+    def generate(self, prompt, **kwargs):
+        """参数同 OllamaClient.generate"""
+        tried = set()
+        while True:
+            endpoint = self._acquire(tried)
+            try:
+                return endpoint.client.generate(prompt, **kwargs)
+            except requests.RequestException as e:
+                tried.add(endpoint)
+                if not _is_failover_error(e) or len(tried) >= len(self.endpoints):
+                    raise
+            finally:
+                self._release(endpoint)
+
+    def warm_up(self, model=OLLAMA_MODEL):
+        """并行预热所有健康节点，返回 (最慢节点的耗时, 错误信息列表)，全部失败时耗时为 None"""
+        endpoints = [endpoint for endpoint in self.endpoints if endpoint.client.available()]
+        elapsed = []
+        errors = []
+
+        def warm(endpoint):
+            try:
+                elapsed.append(endpoint.client.warm_up(model))
+            except requests.RequestException as e:
+                errors.append(f"{endpoint.client.base_url}: {e}")
+
+        threads = [threading.Thread(target=warm, args=(endpoint,), daemon=True) for endpoint in endpoints]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return (max(elapsed) if elapsed else None), errors
+
+    def summary(self):
+        """各节点的请求分布（仅多节点时输出）"""
+        if len(self.endpoints) < 2:
+            return None
+        parts = []
+        for endpoint in self.endpoints:
+            state = "" if endpoint.client.available() else "，已摘除"
+            parts.append(f"{endpoint.client.base_url} {endpoint.client.latency.count} 次{state}")
+        return "🖧 节点分布：" + "；".join(parts)
+
+
+_default_client = None
+_default_lock = threading.Lock()
+
+
+def get_client():
+    """获取全局共享的 Ollama 调度器（未配置多节点时只有 OLLAMA_API_URL 一个节点）"""
+    global _default_client
+    with _default_lock:
+        if _default_client is None:
+            _default_client = OllamaDispatcher.from_settings()
+        return _default_client
@@ -0,0 +1,182 @@
+import queue
+import threading
+
+from config import PIPELINE_READERS, PIPELINE_QUEUE_SIZE, FILE_INDEX_ENABLED, WALK_MAX_FILE_BYTES
+from core.content_store import ContentStore, UNREADABLE
+from core.file_index import FileIndex
+from core.walker import walk_files, WalkStats
+
+_DONE = object()
+
+
+class FileSource:
+    """流式文件来源：遍历线程 → 登记线程 → 审计线程
+
+    各级之间是有界队列：审计跟不上时登记和遍历会阻塞等待（背压）。
+    队列中传递的是惰性引用（core.content_store.ContentRef），文件正文由审计线程按需读取、用完即释放，
+    内存占用与项目大小无关。遍历一开始，审计线程就能拿到第一个文件。
+    迭代产生 (路径, 内容或引用)，顺序与登记完成顺序一致；paths 按遍历顺序记录全部匹配文件。
+    transform(路径, 内容) 在登记线程中执行，返回实际送审的内容，返回 None 表示跳过该文件（如增量审计中未变化的文件）。
+    screen(路径, 内容) 同样在登记线程中执行（如静态预筛），返回假值的文件跳过并记入 screened，须在 start() 前设置。
+    设置了 transform 或 screen 时文件已在登记线程中读出，直接传递文本，审计线程不再重复读取。
+    use_index 为真时通过各项目的文件索引（core.file_index.FileIndex）遍历，未变化的文件不再读取检查，
+    close() 时把读取过程中算出的内容哈希写回索引。
+    """
+
+    def __init__(self, roots, extensions, transform=None, readers=PIPELINE_READERS, queue_size=PIPELINE_QUEUE_SIZE,
+                 use_index=FILE_INDEX_ENABLED, **walk_options):
+        self.roots = [roots] if isinstance(roots, str) else list(roots)
+        self.extensions = tuple(extensions)
+        self.transform = transform
+        self.screen = None
+        self.screened = []  # 被 screen 跳过的文件路径
+        self.walk_options = walk_options  # 传给 core.walker.walk_files 的排除目录、大小上限等选项
+        self.use_index = use_index
+        self.indexes = []  # 本次扫描用到的 FileIndex，与 roots 一一对应
+        self.readers = max(1, int(readers))
+        self.queue_size = queue_size
+        self.paths = []  # 匹配的文件路径（遍历顺序）
+        self.walk_stats = WalkStats()
+        self.store = ContentStore(max_member_bytes=walk_options.get('max_size', WALK_MAX_FILE_BYTES))
+        self.filtered = 0  # 被 transform 跳过或无法访问的文件数
+        self.walk_done = False
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+        self._contents = None
+        self._walker = None
+        self._closed = False
+
+    @property
+    def matched(self):
+        return len(self.paths)
+
+    @property
+    def walked(self):
+        """遍历到的文件总数"""
+        return self.walk_stats.walked
+
+    @property
+    def errors(self):
+        """读取失败的文件和无法打开的压缩包 [(路径, 错误信息)]"""
+        return self.walk_stats.archive_errors + self.store.errors
+
+    @property
+    def pending_total(self):
+        """到目前为止需要送审的文件数（匹配数减去被跳过的）"""
+        return self.matched - self.filtered
+
+    def close(self):
+        """停止遍历和读取（迭代结束或审计结束/被中断时调用），写回已算出的内容哈希并关闭索引
+
+        可重复调用。先等遍历线程退出：索引在遍历结束时写入变化，之后才能关闭数据库连接。
+        """
+        self._stop.set()
+        if self._walker is not None:
+            self._walker.join()
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+        self.store.close()
+        if self.indexes:
+            hashes = self.store.hashes()
+            for index in self.indexes:
+                index.record_hashes(hashes)
+                index.close()
+
+    def index_summary(self):
+        """各项目文件索引的变化统计（未启用索引时为空列表）"""
+        return [index.summary() for index in self.indexes]
+
+    def _put(self, target, item):
+        """放入有界队列；停止后放弃，避免阻塞在已无人消费的队列上"""
+        while not self._stop.is_set():
+            try:
+                target.put(item, timeout=0.2)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _entries(self):
+        if not self.use_index:
+            yield from walk_files(self.roots, self.extensions, stats=self.walk_stats, **self.walk_options)
+            return
+        for root in self.roots:
+            index = FileIndex(root)
+            self.indexes.append(index)
+            yield from index.refresh(self.extensions, stats=self.walk_stats, **self.walk_options)
+
+    def _sha256(self, path):
+        for index in self.indexes:
+            if path in index.sha256:
+                return index.sha256[path]
+        return None
+
+    def _walk(self, paths):
+        entries = self._entries()
+        try:
+            for entry in entries:
+                self.paths.append(entry.path)
+                if not self._put(paths, entry):
+                    return
+        finally:
+            # 提前结束时关闭生成器，让索引写入已遍历部分的变化
+            entries.close()
+            self.walk_done = True
+            for _ in range(self.readers):
+                self._put(paths, _DONE)
+
+    def _read(self, paths, contents):
+        while not self._stop.is_set():
+            try:
+                entry = paths.get(timeout=0.2)
+            except queue.Empty:
+                continue
+            if entry is _DONE:
+                break
+            path = entry.path
+            content = self.store.add(path, entry.size, entry.mtime, self._sha256(path))
+            if content is not None and (self.transform or self.screen):
+                content = self.store.read(path)
+                if self.transform:
+                    content = self.transform(path, content) if content is not UNREADABLE else None
+                # 读取失败的文件不筛选，仍交给审计流程给出警告
+                if content not in (None, UNREADABLE) and self.screen and not self.screen(path, content):
+                    with self._lock:
+                        self.screened.append(path)
+                    content = None
+            if content is None:
+                with self._lock:
+                    self.filtered += 1
+                continue
+            if not self._put(contents, (path, content)):
+                return
+        self._put(contents, _DONE)
+
+    def start(self):
+        """启动遍历和读取线程（可提前调用，让遍历与模型预热同时进行）"""
+        with self._lock:
+            if self._contents is not None:
+                return
+            paths = queue.Queue(maxsize=self.queue_size)
+            self._contents = queue.Queue(maxsize=self.queue_size)
+        self._walker = threading.Thread(target=self._walk, args=(paths,), daemon=True)
+        threads = [self._walker]
+        threads += [threading.Thread(target=self._read, args=(paths, self._contents), daemon=True)
+                    for _ in range(self.readers)]
+        for thread in threads:
+            thread.start()
+
+    def __iter__(self):
+        self.start()
+        finished = 0
+        try:
+            while finished < self.readers:
+                item = self._contents.get()
+                if item is _DONE:
+                    finished += 1
+                    continue
+                yield item
+        finally:
+            self.close()
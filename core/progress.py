@@ -0,0 +1,72 @@
+import threading
+import time
+from collections import deque, namedtuple
+
+from config import PROGRESS_RATE_WINDOW
+
+# 一次汇总的结果：期间收到的条目、当前文件、已完成数、总数、速率（个/秒）、预计剩余秒数（无法估算时为 None）、已用秒数
+ProgressSnapshot = namedtuple('ProgressSnapshot', ['items', 'current', 'done', 'total', 'rate', 'eta', 'elapsed'])
+
+
+class ProgressAggregator:
+    """线程安全的进度汇总（不依赖 Qt）
+
+    工作线程每完成一个文件调用 push()，只在锁内追加数据；界面线程按固定间隔调用 drain()，
+    一次取走期间的全部条目和最新进度，无论文件多快完成，界面每个间隔只刷新一次。
+    速率按最近 window 秒内的完成数估算，剩余时间 = 未完成数 / 速率。push() 应来自同一个线程（按完成顺序调用）。
+    """
+
+    def __init__(self, window=PROGRESS_RATE_WINDOW):
+        self.window = window
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self, total=0):
+        with self._lock:
+            self._items = []
+            self._samples = deque()  # [(时间, 已完成数)]
+            self._started = time.time()
+            self.current = ''
+            self.done = 0
+            self.total = total
+
+    def push(self, current, done, total, item=None):
+        """记录一次进度；item 不为 None 时随下一次 drain() 交给界面（如 FileEvent）"""
+        now = time.time()
+        with self._lock:
+            if item is not None:
+                self._items.append(item)
+            if done < self.done:
+                # 进度回退说明开始了新的一轮（如 JS 提取进入下一个目录），速率重新计算
+                self._samples.clear()
+                self._started = now
+            self.current = current
+            self.done = done
+            self.total = max(total, done)
+            self._samples.append((now, self.done))
+            while len(self._samples) > 1 and now - self._samples[0][0] > self.window:
+                self._samples.popleft()
+
+    def drain(self):
+        """取走上次调用以来的条目并返回当前进度"""
+        now = time.time()
+        with self._lock:
+            items, self._items = self._items, []
+            if self._samples and now - self._started > self.window:
+                since, base = self._samples[0]
+            else:
+                # 不足一个窗口时从开始计算，避免前几个文件的偶然快慢造成大幅波动
+                since, base = self._started, 0
+            rate = (self.done - base) / (now - since) if now > since and self.done > base else 0.0
+            eta = (self.total - self.done) / rate if rate > 0 else None
+            return ProgressSnapshot(items, self.current, self.done, self.total, rate, eta, now - self._started)
+
+
+def format_duration(seconds):
+    """秒数转为 1h02m、3m05s、12s 这样的简短写法"""
+    seconds = int(seconds + 0.5)
+    if seconds >= 3600:
+        return f"{seconds // 3600}h{seconds % 3600 // 60:02d}m"
+    if seconds >= 60:
+        return f"{seconds // 60}m{seconds % 60:02d}s"
+    return f"{seconds}s"
@@ -0,0 +1,131 @@
+import re
+from collections import namedtuple
+
+from config import JS_ROUTE_MAX_SOURCES
+
+# 合并后的路由：路由模板、原始匹配次数、来源文件（最多保留 JS_ROUTE_MAX_SOURCES 个）
+Route = namedtuple('Route', ['pattern', 'count', 'sources'])
+
+# 整段（扩展名之前）为数字、UUID 或 16 位以上十六进制串的路径段，整条路径一次替换
+_PARAM_SEGMENT = re.compile(
+    r'(?<=/)(?:([0-9]+)|([0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12})'
+    r'|([0-9a-fA-F]{16,}))(?=/|\.[a-zA-Z]|$)'
+)
+_ORIGIN = re.compile(r'^[a-zA-Z][a-zA-Z0-9+.\-]*://[^/]*')
+
+
+def _placeholder(match):
+    if match.group(1):
+        return '{id}'
+    if match.group(2):
+        return '{uuid}'
+    # 全是字母的十六进制串（如 deadbeef…）更可能是普通单词
+    return match.group() if match.group(3).isalpha() else '{hash}'
+
+
+def normalize_path(path):
+    """把路径中的参数段替换为占位符：数字 → {id}，UUID → {uuid}，16 位以上十六进制串 → {hash}
+
+    带扩展名的段只替换主干部分（/item/12.json → /item/{id}.json）。
+    """
+    return _PARAM_SEGMENT.sub(_placeholder, path)
+
+
+def route_of(api):
+    """API 对应的 (源站, 规范化后的路径)，源站为空表示以 / 开头的相对路径；查询串和锚点被去掉"""
+    match = _ORIGIN.match(api) if '://' in api else None
+    origin = match.group() if match else ''
+    path = api[len(origin):]
+    if '?' in path or '#' in path:
+        path = path.split('?', 1)[0].split('#', 1)[0]
+    return origin, normalize_path(path)
+
+
+def route_pattern(api):
+    """API 对应的路由模板，写法与 RouteTrie.routes() 一致（多余的 / 被合并）"""
+    origin, path = route_of(api)
+    return _join((origin,) + tuple(segment for segment in path.split('/') if segment))
+
+
+class _Node:
+    __slots__ = ('children', 'count', 'sources')
+
+    def __init__(self):
+        self.children = {}
+        self.count = 0  # 以该节点结尾的原始匹配次数，为 0 表示不是一条路由的终点
+        self.sources = []
+
+
+class RouteTrie:
+    """按路径段组织的路由前缀树
+
+    /user/1、/user/2 … 规范化为同一条 /user/{id}，只保留一个节点并累计次数和来源文件，
+    内存占用和输出条数随不同路由的数量增长，与原始匹配数无关。可以跨进程传递并合并。
+    """
+
+    def __init__(self, max_sources=JS_ROUTE_MAX_SOURCES):
+        self.max_sources = max_sources
+        self.root = _Node()
+        self.size = 0  # 不同路由的数量
+        self._leaves = {}  # {(源站, 路由模板): 终点节点}，重复出现的路由不必逐段遍历
+
+    def __len__(self):
+        return self.size
+
+    def _add_to(self, node, count, sources):
+        """累计到终点节点，返回该节点是否第一次成为路由"""
+        new = node.count == 0
+        if new:
+            self.size += 1
+        node.count += count
+        for source in sources:
+            if len(node.sources) >= self.max_sources:
+                break
+            if source not in node.sources:
+                node.sources.append(source)
+        return new
+
+    def add(self, api, source=None, count=1):
+        """加入一个 API，返回规范化后的路由模板是否为新出现的路由"""
+        key = route_of(api)
+        node = self._leaves.get(key)
+        if node is None:
+            node = self.root
+            for segment in [key[0]] + [segment for segment in key[1].split('/') if segment]:
+                child = node.children.get(segment)
+                if child is None:
+                    child = node.children[segment] = _Node()
+                node = child
+            self._leaves[key] = node
+        return self._add_to(node, count, [source] if source else [])
+
+    def merge(self, other):
+        """合并另一棵树（如子进程返回的批次结果），返回新出现的路由模板列表"""
+        added = []
+        stack = [(self.root, other.root, ())]
+        while stack:
+            node, theirs, parts = stack.pop()
+            if theirs.count and self._add_to(node, theirs.count, theirs.sources):
+                added.append(_join(parts))
+            for segment, their_child in theirs.children.items():
+                child = node.children.get(segment)
+                if child is None:
+                    child = node.children[segment] = _Node()
+                stack.append((child, their_child, parts + (segment,)))
+        return sorted(added)
+
+    def routes(self):
+        """按路由模板排序产出 Route"""
+        stack = [(self.root, ())]
+        found = []
+        while stack:
+            node, parts = stack.pop()
+            if node.count:
+                found.append(Route(_join(parts), node.count, list(node.sources)))
+            stack.extend((child, parts + (segment,)) for segment, child in node.children.items())
+        return sorted(found)
+
+
+def _join(parts):
+    origin, segments = (parts[0], parts[1:]) if parts else ('', ())
+    return origin + '/' + '/'.join(segments)
@@ -0,0 +1,119 @@
+import json
+import re
+
+import requests
+
+# 模型明确表示"无发现"的完整首行（"无过滤的参数直接拼接……"这类以"无"开头的漏洞描述不能算作无发现）
+NO_FINDING_RE = re.compile(
+    r'(?:无|没有|未发现|未检测到|没有发现|不存在)(?:任何)?(?:明显|明确)?的?(?:高危|中危|高危或中危|安全)?'
+    r'(?:漏洞|风险|问题|安全问题|webshell)?'
+    r'|none|no\s+(?:vulnerabilit(?:y|ies)|issues?|findings?|webshell)(?:\s+(?:found|detected))?',
+    re.IGNORECASE
+)
+
+_THINK_OPEN = "<think>"
+_THINK_CLOSE = "</think>"
+
+
+def _partial_tag_length(text, tag):
+    """text 末尾与 tag 前缀重合的长度（标签可能被拆在两个 token 中）"""
+    for size in range(min(len(tag) - 1, len(text)), 0, -1):
+        if text.endswith(tag[:size]):
+            return size
+    return 0
+
+
+class ThinkFilter:
+    """流式过滤 <think>...</think> 思考过程，只保留最终回答"""
+
+    def __init__(self):
+        self.in_think = False
+        self.pending = ""
+
+    def feed(self, token):
+        """输入一个 token，返回其中可见的回答部分"""
+        self.pending += token
+        visible = []
+        while self.pending:
+            tag = _THINK_CLOSE if self.in_think else _THINK_OPEN
+            index = self.pending.find(tag)
+            if index >= 0:
+                if not self.in_think:
+                    visible.append(self.pending[:index])
+                self.pending = self.pending[index + len(tag):]
+                self.in_think = not self.in_think
+                continue
+
+            # 保留可能是半个标签的结尾，其余部分直接输出或丢弃
+            keep = _partial_tag_length(self.pending, tag)
+            if not self.in_think:
+                visible.append(self.pending[:len(self.pending) - keep])
+            self.pending = self.pending[len(self.pending) - keep:]
+            break
+        return "".join(visible)
+
+    def flush(self):
+        """流结束时输出剩余的可见内容"""
+        rest = "" if self.in_think else self.pending
+        self.pending = ""
+        return rest
+
+
+def is_clear_no_finding(visible):
+    """首行已完整输出，且整行就是"无发现"的表述"""
+    text = visible.lstrip()
+    if '\n' not in text:
+        return False
+    first_line = text.split('\n', 1)[0].strip().rstrip('。.！!')
+    return NO_FINDING_RE.fullmatch(first_line) is not None
+
+
+def stream_generate(api_url, payload, timeout, max_chars=0, early_stop=True, session=None):
+    """以流式方式调用 /api/generate，边接收边解析 NDJSON
+
+    返回 (回答文本, 提前终止原因)。回答中已去除思考过程；
+    提前终止原因为 None、"no_finding"（已明确无发现）或 "max_chars"（超过输出长度上限）。
+    提前终止时直接关闭连接，Ollama 会随之停止生成。
+    """
+    think_filter = ThinkFilter()
+    visible = []
+    visible_len = 0
+    generated = 0
+    reason = None
+
+    response = (session or requests).post(api_url, json=dict(payload, stream=True), timeout=timeout, stream=True)
+    try:
+        response.raise_for_status()
+        for line in response.iter_lines():
+            if not line:
+                continue
+            # 流中途的错误和无法解析的行都按 HTTP 错误上报，由 OllamaClient 统一计入统计与熔断
+            try:
+                chunk = json.loads(line)
+            except ValueError as e:
+                raise requests.HTTPError(f"流式响应解析失败: {e}", response=response) from e
+            if "error" in chunk:
+                raise requests.HTTPError(chunk["error"], response=response)
+
+            token = chunk.get("response", "")
+            generated += len(token)
+            text = think_filter.feed(token)
+            if text:
+                visible.append(text)
+                visible_len += len(text)
+
+            if chunk.get("done"):
+                break
+            if max_chars and generated >= max_chars:
+                reason = "max_chars"
+                break
+            # "无发现"的回答都很短，只在回答开头阶段做判断
+            if early_stop and 0 < visible_len <= 256 and is_clear_no_finding("".join(visible)):
+                reason = "no_finding"
+                break
+    finally:
+        response.close()
+
+    if reason is None:
+        visible.append(think_filter.flush())
+    return "".join(visible), reason
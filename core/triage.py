@@ -0,0 +1,123 @@
+import os
+import re
+
+# 每条规则：(分类, 权重, 正则)。分类为 sink（危险函数）、source（用户输入）、upload（文件上传）
+# 用户输入点单独命中也达到默认阈值：输入直接输出、拼接进 SQL 或跳转等写法多种多样，规则无法一一列出，宁可多送审也不漏报
+_PHP_RULES = [
+    ('sink', 3, r'\b(?:eval|assert|system|exec|shell_exec|passthru|popen|proc_open|pcntl_exec)\s*\('),
+    ('sink', 3, r'\b(?:unserialize|create_function|call_user_func(?:_array)?|preg_replace)\s*\('),
+    ('sink', 3, r'\b(?:include|require)(?:_once)?\s*\(?\s*\$'),
+    ('sink', 3, r'\b(?:mysql_query|mysqli_query|pg_query|->query|->exec|->prepare)\s*\([^;]*(?:\.\s*\$|"\s*\.|\$\w+\s*\.|"[^"]*\$\w)'),
+    ('sink', 3, r'\b(?:echo|print|printf|header|setcookie)\b[^;]*\$'),
+    ('sink', 2, r'\b(?:file_put_contents|fwrite|file_get_contents|fopen|readfile|unlink|copy)\s*\([^;]*\$'),
+    ('sink', 3, r'\b(?:base64_decode|gzinflate|gzuncompress|str_rot13)\s*\('),
+    ('sink', 3, r'`[^`]*\$[^`]*`'),
+    ('source', 3, r'\$_(?:GET|POST|REQUEST|COOKIE|SERVER|FILES)\b|php://input'),
+    ('upload', 3, r'\bmove_uploaded_file\s*\(|\$_FILES\b'),
+]
+
+_JAVA_RULES = [
+    ('sink', 3, r'Runtime\s*\.\s*getRuntime\s*\(\s*\)\s*\.\s*exec|new\s+ProcessBuilder\b'),
+    ('sink', 3, r'\.(?:executeQuery|executeUpdate|execute|createQuery|createNativeQuery|prepareStatement)\s*\([^;]*"\s*\+'),
+    ('sink', 3, r'\bnew\s+ObjectInputStream\b|\.readObject\s*\(|XMLDecoder|ScriptEngine|\bInitialContext\b|\.lookup\s*\('),
+    ('sink', 2, r'new\s+File(?:InputStream|OutputStream|Reader|Writer)?\s*\([^;]*\+|Paths\.get\s*\([^;]*\+'),
+    ('sink', 2, r'\$\{[^}]*param'),
+    ('sink', 3, r'<%=|\bout\s*\.\s*print(?:ln)?\s*\(|\.sendRedirect\s*\('),
+    ('source', 3, r'request\s*\.\s*get(?:Parameter|ParameterValues|Header|InputStream|Reader|QueryString|Cookies)\b'),
+    ('source', 3, r'@(?:RequestParam|PathVariable|RequestBody|RequestHeader)\b'),
+    ('upload', 3, r'\bMultipartFile\b|\.getPart\s*\(|ServletFileUpload|transferTo\s*\('),
+]
+
+_PYTHON_RULES = [
+    ('sink', 3, r'\b(?:eval|exec)\s*\(|\bos\.(?:system|popen)\s*\(|subprocess\.\w+\([^)]*shell\s*=\s*True'),
+    ('sink', 3, r'\b(?:pickle|cPickle|marshal)\.loads?\s*\(|yaml\.load\s*\((?![^)]*SafeLoader)'),
+    ('sink', 3, r'\.execute\s*\(\s*(?:f["\']|["\'][^"\']*["\']\s*(?:%|\+|\.format))'),
+    ('sink', 2, r'render_template_string\s*\(|\bopen\s*\([^)]*request\b|send_file\s*\('),
+    ('sink', 3, r'\b(?:redirect|make_response|HttpResponse)\s*\([^)]*request\b|\breturn\b[^\n]*\+\s*request\.'),
+    ('source', 3, r'\brequest\.(?:args|form|values|json|data|files|cookies|headers|GET|POST|FILES|body)\b|\binput\s*\(|sys\.argv'),
+    ('upload', 3, r'request\.files\b|request\.FILES\b|\.save\s*\(\s*os\.path\.join'),
+]
+
+_JS_RULES = [
+    ('sink', 3, r'\beval\s*\(|\bnew\s+Function\s*\(|child_process|\bexecSync?\s*\(|\bspawn\s*\('),
+    ('sink', 3, r'\.innerHTML\s*=|\.outerHTML\s*=|document\.write\s*\(|dangerouslySetInnerHTML|v-html\b'),
+    ('sink', 3, r'\.(?:query|raw|execute)\s*\(\s*(?:`[^`]*\$\{|["\'][^"\']*["\']\s*\+)'),
+    ('sink', 2, r'\b(?:setTimeout|setInterval)\s*\(\s*["\'`]|fs\.(?:readFile|writeFile|createReadStream)\w*\s*\([^)]*req\b'),
+    ('sink', 3, r'\bres\.(?:send|write|end|redirect)\s*\([^)]*req\.'),
+    ('source', 3, r'\breq\.(?:query|body|params|cookies|headers)\b|location\.(?:hash|search|href)|document\.cookie|postMessage|addEventListener\s*\(\s*["\']message'),
+    ('upload', 3, r'\bmulter\b|\bformidable\b|req\.files?\b|type\s*=\s*["\']file["\']'),
+]
+
+_ASP_RULES = [
+    ('sink', 3, r'\b(?:Execute|ExecuteGlobal|Eval)\s*\(|WScript\.Shell|Scripting\.FileSystemObject|Process\.Start'),
+    ('sink', 3, r'\.(?:Execute|Open)\s*\([^)]*&\s*Request'),
+    ('sink', 3, r'\bResponse\s*\.\s*(?:Write|Redirect)\s*\([^)]*Request'),
+    ('source', 3, r'\bRequest\s*(?:\.\s*(?:Form|QueryString|Cookies|ServerVariables))?\s*\('),
+    ('upload', 3, r'SaveAs\s*\(|\.PostedFile\b'),
+]
+
+_C_RULES = [
+    ('sink', 3, r'\b(?:system|popen|execl|execlp|execv|execvp)\s*\('),
+    ('sink', 3, r'\b(?:strcpy|strcat|sprintf|gets|vsprintf|scanf)\s*\('),
+    ('source', 3, r'\bargv\b|\bgetenv\s*\(|\brecv(?:from)?\s*\(|\bread\s*\('),
+]
+
+_LANGUAGE_RULES = {
+    '.php': _PHP_RULES, '.phtml': _PHP_RULES, '.inc': _PHP_RULES,
+    '.java': _JAVA_RULES, '.jsp': _JAVA_RULES, '.jspx': _JAVA_RULES,
+    '.py': _PYTHON_RULES, '.pyw': _PYTHON_RULES,
+    '.js': _JS_RULES, '.jsx': _JS_RULES, '.ts': _JS_RULES, '.tsx': _JS_RULES, '.vue': _JS_RULES,
+    '.html': _JS_RULES, '.htm': _JS_RULES, '.shtml': _JS_RULES,
+    '.asp': _ASP_RULES, '.aspx': _ASP_RULES, '.ashx': _ASP_RULES, '.cs': _ASP_RULES,
+    '.c': _C_RULES, '.cpp': _C_RULES, '.h': _C_RULES, '.hpp': _C_RULES,
+}
+
+_COMPILED = {}
+
+
+def _rules_for(filepath):
+    """按扩展名选择规则，未知类型使用全部规则"""
+    ext = os.path.splitext(filepath)[1].lower()
+    key = ext if ext in _LANGUAGE_RULES else '*'
+    if key not in _COMPILED:
+        if key == '*':
+            rules = [rule for rules in (_PHP_RULES, _JAVA_RULES, _PYTHON_RULES, _JS_RULES, _ASP_RULES) for rule in rules]
+        else:
+            rules = _LANGUAGE_RULES[key]
+        _COMPILED[key] = [(kind, weight, re.compile(pattern)) for kind, weight, pattern in rules]
+    return _COMPILED[key]
+
+
+def score_file(filepath, content):
+    """按危险函数和用户输入点为文件打分，返回 (分数, 命中的分类集合)"""
+    score = 0
+    kinds = set()
+    for kind, weight, pattern in _rules_for(filepath):
+        if pattern.search(content):
+            score += weight
+            kinds.add(kind)
+    # 同时存在用户输入和危险函数时更可能形成可利用的漏洞
+    if 'source' in kinds and ('sink' in kinds or 'upload' in kinds):
+        score += 2
+    return score, kinds
+
+
+def should_audit(filepath, content, threshold):
+    """文件是否需要送模型审计：风险分达到 threshold，或为空文件（仍交给审计流程给出警告）"""
+    return not content or score_file(filepath, content)[0] >= threshold
+
+
+def triage_stream(items, threshold, skipped):
+    """流式静态预筛：产出需要送模型审计的 (路径, 内容)，被跳过的路径追加到 skipped"""
+    for filepath, content in items:
+        if should_audit(filepath, content, threshold):
+            yield filepath, content
+        else:
+            skipped.append(filepath)
+
+
+def triage_files(files_content, threshold):
+    """静态预筛：返回 (需要送模型审计的文件, 被跳过的文件路径列表)"""
+    skipped = []
+    selected = dict(triage_stream(files_content.items(), threshold, skipped))
+    return selected, skipped
@@ -0,0 +1,209 @@
+import os
+import re
+from collections import namedtuple
+
+from config import WALK_EXCLUDE_DIRS, WALK_RESPECT_GITIGNORE, WALK_MAX_FILE_BYTES, WALK_BINARY_SNIFF_BYTES
+from config import ARCHIVE_SCAN_ENABLED, ARCHIVE_EXTENSIONS
+from core.archive import iter_archive
+
+WalkEntry = namedtuple('WalkEntry', ['path', 'size', 'mtime'])
+
+
+class WalkStats:
+    """遍历统计"""
+
+    def __init__(self):
+        self.walked = 0  # 遍历到的文件总数
+        self.pruned_dirs = 0  # 被排除目录规则或 .gitignore 剪掉的目录数
+        self.ignored = 0  # 被 .gitignore 忽略的文件数
+        self.too_large = 0  # 超过大小上限的文件数
+        self.binary = 0  # 判定为二进制的文件数
+        self.archives = 0  # 展开的压缩包数
+        self.archive_errors = []  # 无法打开的压缩包 [(路径, 错误信息)]
+
+
+def _glob_to_regex(pattern):
+    """把 .gitignore 的通配符转换为正则（* 不跨目录，** 可跨任意层目录）"""
+    regex = []
+    i = 0
+    while i < len(pattern):
+        char = pattern[i]
+        if pattern.startswith('**/', i):
+            regex.append('(?:.*/)?')
+            i += 3
+            continue
+        if pattern.startswith('**', i):
+            regex.append('.*')
+            i += 2
+            continue
+        if char == '*':
+            regex.append('[^/]*')
+        elif char == '?':
+            regex.append('[^/]')
+        elif char == '[':
+            # 与 fnmatch.translate 一致：只有类开头的 ! 表示取反，紧随其后的 ] 是普通字符，其余字符照字面匹配
+            j = i + 1
+            if j < len(pattern) and pattern[j] == '!':
+                j += 1
+            if j < len(pattern) and pattern[j] == ']':
+                j += 1
+            end = pattern.find(']', j)
+            if end < 0:
+                regex.append(re.escape(char))
+            else:
+                chars = pattern[i + 1:end]
+                negate = chars.startswith('!')
+                chars = re.sub(r'([\\\[\]^&~|])', r'\\\1', chars[1:] if negate else chars)
+                regex.append('[' + ('^' if negate else '') + chars + ']')
+                i = end
+        else:
+            regex.append(re.escape(char))
+        i += 1
+    return ''.join(regex)
+
+
+class IgnoreRules:
+    """一个目录中 .gitignore 的规则，匹配时使用相对该目录的路径"""
+
+    def __init__(self, base, lines):
+        self.base = base
+        self.rules = []  # [(正则, 是否取反, 是否只匹配目录, 是否匹配完整相对路径)]
+        for line in lines:
+            line = line.rstrip('\n').rstrip()
+            if not line or line.startswith('#'):
+                continue
+            negate = line.startswith('!')
+            if negate:
+                line = line[1:]
+            dir_only = line.endswith('/')
+            line = line.rstrip('/')
+            # 中间或开头带 / 的模式相对 .gitignore 所在目录，否则匹配任意层级的文件名
+            anchored = '/' in line
+            line = line.lstrip('/')
+            if line:
+                self.rules.append((re.compile(_glob_to_regex(line) + '$'), negate, dir_only, anchored))
+
+    @classmethod
+    def load(cls, directory):
+        try:
+            with open(os.path.join(directory, '.gitignore'), 'r', encoding='utf-8', errors='replace') as f:
+                rules = cls(directory, f)
+        except OSError:
+            return None
+        return rules if rules.rules else None
+
+    def match(self, path, name, is_dir):
+        """返回 True（忽略）、False（显式不忽略）或 None（无规则命中）"""
+        result = None
+        relpath = None
+        for regex, negate, dir_only, anchored in self.rules:
+            if dir_only and not is_dir:
+                continue
+            if anchored:
+                if relpath is None:
+                    relpath = os.path.relpath(path, self.base).replace(os.sep, '/')
+                target = relpath
+            else:
+                target = name
+            if regex.match(target):
+                result = not negate
+        return result
+
+
+def _ignored(ignore_stack, path, name, is_dir):
+    # 外层规则先匹配，内层 .gitignore 和靠后的规则优先
+    result = None
+    for rules in ignore_stack:
+        verdict = rules.match(path, name, is_dir)
+        if verdict is not None:
+            result = verdict
+    return bool(result)
+
+
+def is_binary(path, sniff_bytes=WALK_BINARY_SNIFF_BYTES):
+    """文件开头包含 NUL 字节即视为二进制"""
+    try:
+        with open(path, 'rb') as f:
+            return b'\0' in f.read(sniff_bytes)
+    except OSError:
+        return False
+
+
+def walk_files(roots, extensions, exclude_dirs=None, gitignore=WALK_RESPECT_GITIGNORE,
+               max_size=WALK_MAX_FILE_BYTES, sniff_bytes=WALK_BINARY_SNIFF_BYTES, stats=None, known=None,
+               archives=ARCHIVE_SCAN_ENABLED, expand=None):
+    """基于 os.scandir 的文件遍历，按目录名有序产出匹配扩展名的 WalkEntry
+
+    排除目录（默认 WALK_EXCLUDE_DIRS）和 .gitignore 命中的目录整体剪掉，不再进入；
+    超过 max_size 的文件和开头含 NUL 字节的二进制文件被跳过（0 表示不检查）。
+    扩展名比较不区分大小写，每个文件只做一次集合查找。
+    known 为 {路径: (大小, 修改时间)}，记录上次已确认为文本的文件，未变化时不再读取开头做二进制检查。
+    archives 为真时 jar/war/zip 被当作目录展开，产出包内匹配文件的虚拟路径（见 core.archive），
+    expand(WalkEntry) 可替换默认的展开方式（如文件索引对未变化的包直接沿用上次的清单）。
+    """
+    roots = [roots] if isinstance(roots, str) else roots
+    suffixes = {ext.lower() for ext in extensions}
+    excluded = set(WALK_EXCLUDE_DIRS if exclude_dirs is None else exclude_dirs)
+    stats = stats if stats is not None else WalkStats()
+    known = known or {}
+    archive_suffixes = set(ARCHIVE_EXTENSIONS) if archives else set()
+    if expand is None:
+        def expand(archive):
+            return iter_archive(archive.path, suffixes, max_size, archive.mtime,
+                                stats=stats, errors=stats.archive_errors)
+
+    for root in roots:
+        stack = [(root, ())]
+        while stack:
+            directory, ignore_stack = stack.pop()
+            if gitignore:
+                rules = IgnoreRules.load(directory)
+                if rules:
+                    ignore_stack = ignore_stack + (rules,)
+            try:
+                with os.scandir(directory) as it:
+                    entries = sorted(it, key=lambda entry: entry.name)
+            except OSError:
+                continue
+
+            subdirs = []
+            for entry in entries:
+                try:
+                    is_dir = entry.is_dir(follow_symlinks=False)
+                except OSError:
+                    continue
+                if is_dir:
+                    if entry.name in excluded or (ignore_stack and _ignored(ignore_stack, entry.path, entry.name, True)):
+                        stats.pruned_dirs += 1
+                    else:
+                        subdirs.append(entry.path)
+                    continue
+
+                stats.walked += 1
+                suffix = os.path.splitext(entry.name)[1].lower()
+                if suffix not in suffixes and suffix not in archive_suffixes:
+                    continue
+                if ignore_stack and _ignored(ignore_stack, entry.path, entry.name, False):
+                    stats.ignored += 1
+                    continue
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                if suffix in archive_suffixes:
+                    # 压缩包不受大小上限和二进制检查的限制，只展开包内匹配的文件
+                    stats.archives += 1
+                    for member in expand(WalkEntry(entry.path, stat.st_size, stat.st_mtime)):
+                        yield WalkEntry(*member)
+                    continue
+                if max_size and stat.st_size > max_size:
+                    stats.too_large += 1
+                    continue
+                if (sniff_bytes and stat.st_size and known.get(entry.path) != (stat.st_size, stat.st_mtime)
+                        and is_binary(entry.path, sniff_bytes)):
+                    stats.binary += 1
+                    continue
+                yield WalkEntry(entry.path, stat.st_size, stat.st_mtime)
+
+            # 倒序压栈，出栈时按名称顺序遍历子目录（先深度优先，与 os.walk 的输出顺序一致）
+            stack.extend((path, ignore_stack) for path in reversed(subdirs))
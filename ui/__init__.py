@@ -1,2 +1,2 @@
-from .components import CyberTextEdit
+from .components import CyberTextEdit
 from .main_window import CyberScanner 
\ No newline at end of file
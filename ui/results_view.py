@@ -0,0 +1,314 @@
+from bisect import bisect_right
+from operator import itemgetter
+
+from PyQt5 import QtWidgets, QtGui, QtCore
+
+from ui.styles import RESULTS_TABLE_STYLE, COLORS
+
+# 结果等级：数值越小越严重，等级列按数值排序
+RANK_HIGH, RANK_MEDIUM, RANK_ERROR, RANK_INFO = range(4)
+RANK_LABELS = ['高危', '中危', '错误', '信息']
+RANK_COLORS = ['#ff3333', '#ffaa00', '#ff66cc', '#00ff00']
+SEVERITY_RANKS = {'high': RANK_HIGH, 'medium': RANK_MEDIUM}
+
+FETCH_CHUNK = 5000  # 每次向视图暴露的行数
+FILTER_DELAY_MS = 250  # 过滤框输入停止后多久再过滤
+SOURCE_LIMIT = 5  # 合并重复行时来源列最多保留的来源数
+INSERT_LIMIT = 100  # 排序状态下一批新行不超过该数量时原地插入，否则整体归并
+
+
+class ResultsTableModel(QtCore.QAbstractTableModel):
+    """漏洞和接口结果的表格模型
+
+    每行为 (等级, 类型, 内容, 来源, 详情)。全部结果保存在 _rows 中，过滤和排序后的行（同一批元组的引用）
+    保存在 _view 中，视图通过 canFetchMore / fetchMore 每次只取 FETCH_CHUNK 行，百万行时也不会一次创建全部索引。
+    过滤、排序都在模型内完成，不经过 QSortFilterProxyModel。
+    """
+    HEADERS = ['等级', '类型', '内容', '来源', '详情']
+    totals_changed = QtCore.pyqtSignal(int, int)  # 显示行数、总行数
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []
+        self._view = []
+        self._keys = {}  # {(类型, 内容): 在 _rows 中的位置}，用于合并重复出现的接口
+        self._exposed = 0
+        self._needle = ''
+        self._rank = None
+        self._sort_column = -1
+        self._descending = False
+        self._sort_keys = []  # 排序时 _view 中各行的排序键
+        self._colors = [QtGui.QBrush(QtGui.QColor(color)) for color in RANK_COLORS]
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else self._exposed
+
+    def columnCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=QtCore.Qt.DisplayRole):
+        if orientation == QtCore.Qt.Horizontal and role == QtCore.Qt.DisplayRole:
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row = self._row(index.row())
+        column = index.column()
+        if role == QtCore.Qt.DisplayRole:
+            return RANK_LABELS[row[0]] if column == 0 else row[column]
+        if role == QtCore.Qt.ForegroundRole and column == 0:
+            return self._colors[row[0]]
+        if role == QtCore.Qt.ToolTipRole and column >= 2:
+            return row[column] or None
+        return None
+
+    def canFetchMore(self, parent=QtCore.QModelIndex()):
+        return not parent.isValid() and self._exposed < len(self._view)
+
+    def fetchMore(self, parent=QtCore.QModelIndex()):
+        if parent.isValid():
+            return
+        count = min(FETCH_CHUNK, len(self._view) - self._exposed)
+        if count <= 0:
+            return
+        self.beginInsertRows(QtCore.QModelIndex(), self._exposed, self._exposed + count - 1)
+        self._exposed += count
+        self.endInsertRows()
+
+    def _accepts(self, row):
+        if self._rank is not None and row[0] != self._rank:
+            return False
+        return not self._needle or self._needle in _haystack(row)
+
+    def _filtered(self):
+        rows = self._rows
+        if self._rank is not None:
+            rows = [row for row in rows if row[0] == self._rank]
+        if self._needle:
+            needle = self._needle
+            rows = [row for row in rows if needle in _haystack(row)]
+        return list(rows) if rows is self._rows else rows
+
+    def add_rows(self, rows, unique=False):
+        """追加一批结果行 (等级, 类型, 内容, 来源, 详情)
+
+        unique 为 True 时按 (类型, 内容) 合并（同一批内的重复行也合并）：已存在的行合并来源、更新详情
+        （如目录完成后补上路由的次数和来源文件，多个目录中出现的同一接口保留各目录的来源）。
+        """
+        added = []
+        updated = False
+        for row in rows:
+            # 行用元组保存：只含字符串和整数的元组会被垃圾回收器移出跟踪，百万行时完整回收不必逐行遍历
+            row = tuple(row)
+            if unique:
+                key = (row[1], row[2])
+                index = self._keys.get(key)
+                if index is not None:
+                    # 位置超出 _rows 的行还在本批的 added 中
+                    stored, position = ((self._rows, index) if index < len(self._rows)
+                                        else (added, index - len(self._rows)))
+                    old = stored[position]
+                    merged = old[:3] + (_merge_sources(old[3], row[3]), row[4] or old[4])
+                    if merged != old:
+                        stored[position] = merged
+                        updated = updated or stored is self._rows
+                    continue
+                self._keys[key] = len(self._rows) + len(added)
+            added.append(row)
+        self._rows.extend(added)
+        if updated:
+            # _view 中仍是旧的行对象，整体重新过滤排序一次（一般只在目录完成时发生）
+            self._rebuild_view()
+        else:
+            matched = [row for row in added if self._accepts(row)]
+            if matched:
+                if self._sort_column < 0:
+                    self._view.extend(matched)
+                else:
+                    self.layoutAboutToBeChanged.emit()
+                    self._merge_sorted(matched)
+                    self.layoutChanged.emit()
+        self._expose_first_chunk()
+        self.totals_changed.emit(len(self._view), len(self._rows))
+
+    def _rebuild_view(self):
+        view = self._filtered()
+        if len(view) < self._exposed:
+            # 行数变少时不能只发 layoutChanged
+            self.beginResetModel()
+            self._view = view
+            if self._sort_column >= 0:
+                self._sort_view()
+            self._exposed = min(len(view), FETCH_CHUNK)
+            self.endResetModel()
+            return
+        self.layoutAboutToBeChanged.emit()
+        self._view = view
+        if self._sort_column >= 0:
+            self._sort_view()
+        self.layoutChanged.emit()
+
+    def _expose_first_chunk(self):
+        """视图还不满一屏（不足一个 FETCH_CHUNK）时直接插入，之后由滚动触发 fetchMore"""
+        target = min(len(self._view), max(self._exposed, FETCH_CHUNK))
+        if target > self._exposed:
+            self.beginInsertRows(QtCore.QModelIndex(), self._exposed, target - 1)
+            self._exposed = target
+            self.endInsertRows()
+
+    def _row(self, position):
+        # _view 始终按升序保存，降序显示时倒过来取
+        return self._view[-1 - position] if self._descending else self._view[position]
+
+    def _sort_view(self):
+        key = itemgetter(self._sort_column)
+        self._view.sort(key=key)
+        self._sort_keys = [key(row) for row in self._view]
+
+    def _merge_sorted(self, rows):
+        """把新行归并进已排序的 _view：按缓存的排序键二分定位，不必对全部行重新取键排序"""
+        key = itemgetter(self._sort_column)
+        rows.sort(key=key)
+        keys = self._sort_keys
+        positions = [bisect_right(keys, key(row)) for row in rows]
+        view = self._view
+        if len(rows) <= INSERT_LIMIT:
+            # 新行较少时原地插入（只移动指针），从后往前插入保证前面的位置不变
+            for position, row in zip(reversed(positions), reversed(rows)):
+                view.insert(position, row)
+                keys.insert(position, key(row))
+            return
+        merged, merged_keys = [], []
+        previous = 0
+        for position, row in zip(positions, rows):
+            merged += view[previous:position]
+            merged_keys += keys[previous:position]
+            merged.append(row)
+            merged_keys.append(key(row))
+            previous = position
+        merged += view[previous:]
+        merged_keys += keys[previous:]
+        self._view, self._sort_keys = merged, merged_keys
+
+    def sort(self, column, order=QtCore.Qt.AscendingOrder):
+        """column 为 -1 时恢复结果产生的顺序"""
+        self.layoutAboutToBeChanged.emit()
+        self._sort_column = column
+        self._descending = column >= 0 and order == QtCore.Qt.DescendingOrder
+        if column < 0:
+            self._view = self._filtered()
+            self._sort_keys = []
+        else:
+            self._sort_view()
+        self.layoutChanged.emit()
+
+    def set_filter(self, text='', rank=None):
+        """按关键字（不区分大小写，匹配类型/内容/来源/详情）和等级过滤"""
+        self._needle = text.strip().lower()
+        self._rank = rank
+        self.beginResetModel()
+        self._view = self._filtered()
+        if self._sort_column >= 0:
+            self._sort_view()
+        self._exposed = min(len(self._view), FETCH_CHUNK)
+        self.endResetModel()
+        self.totals_changed.emit(len(self._view), len(self._rows))
+
+    def clear(self):
+        self.beginResetModel()
+        self._rows = []
+        self._view = []
+        self._sort_keys = []
+        self._keys = {}
+        self._exposed = 0
+        self.endResetModel()
+        self.totals_changed.emit(0, 0)
+
+
+def _merge_sources(old, new):
+    """合并来源列（、分隔），去重并最多保留 SOURCE_LIMIT 个"""
+    if not old or not new or new == old:
+        return old or new
+    sources = old.split('、')
+    for source in new.split('、'):
+        if len(sources) >= SOURCE_LIMIT:
+            break
+        if source not in sources:
+            sources.append(source)
+    return '、'.join(sources)
+
+
+def _haystack(row):
+    return f"{row[1]}\n{row[2]}\n{row[3]}\n{row[4]}".lower()
+
+
+class ResultsView(QtWidgets.QWidget):
+    """结果表格：顶部为关键字过滤框和等级筛选，点击表头排序"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setStyleSheet(RESULTS_TABLE_STYLE)
+        self.model = ResultsTableModel(self)
+
+        layout = QtWidgets.QVBoxLayout(self)
+        layout.setContentsMargins(0, 6, 0, 0)
+        layout.setSpacing(4)
+
+        bar = QtWidgets.QHBoxLayout()
+        self.filter_edit = QtWidgets.QLineEdit()
+        self.filter_edit.setPlaceholderText("🔎 过滤结果（类型 / 内容 / 来源 / 详情）")
+        self.filter_edit.setClearButtonEnabled(True)
+        self.rank_combo = QtWidgets.QComboBox()
+        self.rank_combo.addItem("全部等级", None)
+        for rank, label in enumerate(RANK_LABELS):
+            self.rank_combo.addItem(label, rank)
+        self.count_label = QtWidgets.QLabel("共 0 条")
+        self.count_label.setStyleSheet(f"color: {COLORS['text_secondary']};")
+        bar.addWidget(self.filter_edit, stretch=1)
+        bar.addWidget(self.rank_combo)
+        bar.addWidget(self.count_label)
+        layout.addLayout(bar)
+
+        self.table = QtWidgets.QTableView()
+        self.table.setModel(self.model)
+        self.table.setWordWrap(False)
+        self.table.setAlternatingRowColors(True)
+        self.table.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectRows)
+        self.table.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
+        self.table.setHorizontalScrollMode(QtWidgets.QAbstractItemView.ScrollPerPixel)
+        # 固定行高、不按内容计算列宽，行数再多也不必测量每一行
+        vertical = self.table.verticalHeader()
+        vertical.setVisible(False)
+        vertical.setSectionResizeMode(QtWidgets.QHeaderView.Fixed)
+        vertical.setDefaultSectionSize(self.table.fontMetrics().height() + 8)
+        header = self.table.horizontalHeader()
+        header.setSectionResizeMode(QtWidgets.QHeaderView.Interactive)
+        header.setStretchLastSection(True)
+        for column, width in enumerate([60, 110, 420, 220]):
+            header.resizeSection(column, width)
+        header.setSortIndicator(-1, QtCore.Qt.AscendingOrder)
+        self.table.setSortingEnabled(True)
+        layout.addWidget(self.table, stretch=1)
+
+        self._filter_timer = QtCore.QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(FILTER_DELAY_MS)
+        self._filter_timer.timeout.connect(self.apply_filter)
+        self.filter_edit.textChanged.connect(self._filter_timer.start)
+        self.rank_combo.currentIndexChanged.connect(self.apply_filter)
+        self.model.totals_changed.connect(self.update_count)
+
+    def apply_filter(self):
+        self._filter_timer.stop()
+        self.model.set_filter(self.filter_edit.text(), self.rank_combo.currentData())
+
+    def update_count(self, visible, total):
+        self.count_label.setText(f"共 {total} 条" if visible == total else f"显示 {visible} / 共 {total} 条")
+
+    def add_rows(self, rows, unique=False):
+        self.model.add_rows(rows, unique)
+
+    def clear(self):
+        self.model.clear()